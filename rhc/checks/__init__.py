@@ -1,94 +1,163 @@
-"""Check registry and discovery."""
-
-from rhc.checks.base import BaseCheck
-from rhc.checks.ci import BadgesPresentCheck, CIConfigPresentCheck
-from rhc.checks.deps import (
-    LockfilePresentCheck,
-    MultiplePackageManagersCheck,
-    OutdatedHintsCheck,
-)
-from rhc.checks.docs import (
-    ContributingPresentCheck,
-    LicensePresentCheck,
-    ReadmePresentCheck,
-    SecurityPolicyPresentCheck,
-)
-from rhc.checks.hygiene import (
-    ChangelogPresentCheck,
-    EditorconfigPresentCheck,
-    GitignorePresentCheck,
-    SemverTagsPresentCheck,
-)
-from rhc.checks.security import (
-    CodeownersPresentCheck,
-    DependabotPresentCheck,
-    SecretsSuspectedCheck,
-)
-from rhc.checks.tests import (
-    CIRunsTestsCheck,
-    LinterPresentCheck,
-    TestsDetectedCheck,
-)
-
-# All available checks
-ALL_CHECKS: list[type[BaseCheck]] = [
+"""Check registry and discovery.
+
+Check modules are imported on first use, so looking up a single check (e.g.
+``rhc explain``) only loads the module that defines it.
+"""
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
+
+from rhc.checks.base import BaseCheck, SnapshotCheck
+from rhc.context import Context
+from rhc.types import Finding
+
+# Check ID -> (module, class name), in registration order
+CHECK_LOCATIONS: dict[str, tuple[str, str]] = {
     # Docs
-    ReadmePresentCheck,
-    LicensePresentCheck,
-    ContributingPresentCheck,
-    SecurityPolicyPresentCheck,
+    "DOC.README_PRESENT": ("rhc.checks.docs", "ReadmePresentCheck"),
+    "DOC.LICENSE_PRESENT": ("rhc.checks.docs", "LicensePresentCheck"),
+    "DOC.CONTRIBUTING_PRESENT": ("rhc.checks.docs", "ContributingPresentCheck"),
+    "DOC.SECURITY_POLICY_PRESENT": ("rhc.checks.docs", "SecurityPolicyPresentCheck"),
     # CI
-    CIConfigPresentCheck,
-    BadgesPresentCheck,
+    "CI.CONFIG_PRESENT": ("rhc.checks.ci", "CIConfigPresentCheck"),
+    "CI.BADGES_PRESENT": ("rhc.checks.ci", "BadgesPresentCheck"),
     # Tests
-    TestsDetectedCheck,
-    CIRunsTestsCheck,
-    LinterPresentCheck,
+    "TESTS.DETECTED": ("rhc.checks.tests", "TestsDetectedCheck"),
+    "TESTS.CI_RUNS_TESTS": ("rhc.checks.tests", "CIRunsTestsCheck"),
+    "QUALITY.LINTER_PRESENT": ("rhc.checks.tests", "LinterPresentCheck"),
     # Deps
-    LockfilePresentCheck,
-    OutdatedHintsCheck,
-    MultiplePackageManagersCheck,
+    "DEPS.LOCKFILE_PRESENT": ("rhc.checks.deps", "LockfilePresentCheck"),
+    "DEPS.OUTDATED_HINTS": ("rhc.checks.deps", "OutdatedHintsCheck"),
+    "DEPS.MULTIPLE_PACKAGE_MANAGERS": ("rhc.checks.deps", "MultiplePackageManagersCheck"),
     # Security
-    SecretsSuspectedCheck,
-    DependabotPresentCheck,
-    CodeownersPresentCheck,
+    "SEC.SECRETS_SUSPECTED": ("rhc.checks.security", "SecretsSuspectedCheck"),
+    "SEC.DEPENDABOT_PRESENT": ("rhc.checks.security", "DependabotPresentCheck"),
+    "SEC.CODEOWNERS_PRESENT": ("rhc.checks.security", "CodeownersPresentCheck"),
     # Hygiene
-    GitignorePresentCheck,
-    EditorconfigPresentCheck,
-    SemverTagsPresentCheck,
-    ChangelogPresentCheck,
-]
+    "HYG.GITIGNORE_PRESENT": ("rhc.checks.hygiene", "GitignorePresentCheck"),
+    "HYG.EDITORCONFIG_PRESENT": ("rhc.checks.hygiene", "EditorconfigPresentCheck"),
+    "REL.SEMVER_TAGS_PRESENT": ("rhc.checks.hygiene", "SemverTagsPresentCheck"),
+    "REL.CHANGELOG_PRESENT": ("rhc.checks.hygiene", "ChangelogPresentCheck"),
+}
+
+# Class name -> module, for lazy `from rhc.checks import SomeCheck`
+_MODULE_OF_CLASS: dict[str, str] = {name: module for module, name in CHECK_LOCATIONS.values()}
+
+# Shared check instances, created on first use (checks are stateless)
+_INSTANCES: dict[type[BaseCheck], BaseCheck] = {}
+
+
+def _load_class(check_id: str) -> type[BaseCheck]:
+    """Import the module defining a check and return its class."""
+    module_name, class_name = CHECK_LOCATIONS[check_id]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve check classes and the full registry lazily (PEP 562)."""
+    if name == "ALL_CHECKS":
+        value: Any = [_load_class(check_id) for check_id in CHECK_LOCATIONS]
+    elif name == "CHECKS_BY_ID":
+        value = {check_id: _load_class(check_id) for check_id in CHECK_LOCATIONS}
+    elif name in _MODULE_OF_CLASS:
+        value = getattr(importlib.import_module(_MODULE_OF_CLASS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def _get_instance(check_class: type[BaseCheck]) -> BaseCheck:
+    """Get the shared instance of a check class."""
+    check = _INSTANCES.get(check_class)
+    if check is None:
+        check = _INSTANCES[check_class] = check_class()
+    return check
 
 
 def get_all_checks() -> list[BaseCheck]:
     """Get instances of all registered checks."""
-    return [check_class() for check_class in ALL_CHECKS]
+    return [_get_instance(_load_class(check_id)) for check_id in CHECK_LOCATIONS]
+
+
+def get_checks(only: Sequence[str] | None = None) -> list[BaseCheck]:
+    """Get instances of the requested checks (all when ``only`` is empty).
+
+    Only the modules defining the requested checks are imported. Checks are
+    returned in registry order and unknown IDs are ignored.
+    """
+    if not only:
+        return get_all_checks()
+    only_set = frozenset(only)
+    return [
+        _get_instance(_load_class(check_id))
+        for check_id in CHECK_LOCATIONS
+        if check_id in only_set
+    ]
 
 
 def get_check_by_id(check_id: str) -> BaseCheck | None:
     """Get a check instance by its ID."""
-    for check_class in ALL_CHECKS:
-        check = check_class()
-        if check.id == check_id:
-            return check
-    return None
+    if check_id not in CHECK_LOCATIONS:
+        return None
+    return _get_instance(_load_class(check_id))
 
 
 def filter_checks(
     checks: list[BaseCheck],
-    skip: list[str] | None = None,
-    only: list[str] | None = None,
+    skip: Sequence[str] | None = None,
+    only: Sequence[str] | None = None,
 ) -> list[BaseCheck]:
     """Filter checks based on skip and only lists."""
-    skip = skip or []
-    only = only or []
+    skip_set = frozenset(skip or ())
+    only_set = frozenset(only) if only else None
 
     filtered = []
     for check in checks:
-        if skip and check.id in skip:
+        if check.id in skip_set:
             continue
-        if only and check.id not in only:
+        if only_set is not None and check.id not in only_set:
             continue
         filtered.append(check)
 
     return filtered
+
+
+def run_all(
+    ctx: Context,
+    checks: list[BaseCheck],
+    max_workers: int | None = None,
+) -> list[Finding]:
+    """Run checks against a context and collect their findings in check order.
+
+    Checks are I/O bound and share no mutable state, so unless
+    ``checks.parallel`` is disabled they are dispatched on a thread pool.
+    A check that raises is skipped (and reported when ``debug`` is set).
+    """
+    # List every directory the presence-only checks look at, once
+    snapshot_dirs: set[str] = set()
+    for check in checks:
+        if isinstance(check, SnapshotCheck):
+            snapshot_dirs.update(check.snapshot_dirs())
+    snapshot = ctx.fs.snapshot(snapshot_dirs)
+
+    def run_one(check: BaseCheck) -> list[Finding]:
+        try:
+            if isinstance(check, SnapshotCheck):
+                return check.run_from_snapshot(ctx, snapshot)
+            return check.run(ctx)
+        except Exception as e:
+            if ctx.config.debug:
+                print(f"[DEBUG] Check {check.id} failed: {e}")
+            return []
+
+    if ctx.config.checks.parallel and len(checks) > 1:
+        workers = max_workers or min(32, len(checks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_one, checks))
+    else:
+        results = [run_one(check) for check in checks]
+
+    return [finding for check_findings in results for finding in check_findings]
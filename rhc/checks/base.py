@@ -1,5 +1,6 @@
 """Base check interface."""
 
+import posixpath
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -7,7 +8,7 @@ from rhc.context import Context
 from rhc.types import Category, Finding
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckInfo:
     """Information about a check."""
 
@@ -20,10 +21,29 @@ class CheckInfo:
 
 
 class BaseCheck(ABC):
-    """Base class for all health checks."""
+    """Base class for all health checks.
+
+    Check instances are shared across scans, so subclasses must not keep
+    per-run state on ``self``; everything a run needs comes from ``ctx``.
+    Checks of one scan run concurrently on a thread pool, so ``run`` must
+    also treat ``ctx`` as read-only.
+    """
 
     info: CheckInfo
 
+    # Mirrored from `info` when the subclass is defined
+    id: str
+    category: Category
+    description: str
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        info = cls.__dict__.get("info")
+        if info is not None:
+            cls.id = info.id
+            cls.category = info.category
+            cls.description = info.description
+
     @abstractmethod
     def run(self, ctx: Context) -> list[Finding]:
         """Run the check and return findings.
@@ -33,18 +53,6 @@ class BaseCheck(ABC):
         """
         pass
 
-    @property
-    def id(self) -> str:
-        return self.info.id
-
-    @property
-    def category(self) -> Category:
-        return self.info.category
-
-    @property
-    def description(self) -> str:
-        return self.info.description
-
     def get_weight(self, config_weights: dict[str, int]) -> int:
         """Get the score impact, considering config overrides."""
         return config_weights.get(self.info.id, self.info.default_weight)
@@ -58,3 +66,28 @@ Default Impact: {self.info.default_weight}
 
 {self.info.description}
 """
+
+
+class SnapshotCheck(BaseCheck):
+    """Base class for presence-only checks.
+
+    Subclasses declare the paths they look for in ``wants_files`` (and any
+    directory they inspect as a whole in ``wants_dirs``) and implement
+    ``run_from_snapshot``. The scanner lists every wanted directory once and
+    hands all snapshot checks the same result.
+    """
+
+    wants_files: frozenset[str] = frozenset()
+    wants_dirs: frozenset[str] = frozenset()
+
+    def snapshot_dirs(self) -> frozenset[str]:
+        """Directories that must be listed to answer this check."""
+        return self.wants_dirs | {posixpath.dirname(path) for path in self.wants_files}
+
+    def run(self, ctx: Context) -> list[Finding]:
+        return self.run_from_snapshot(ctx, ctx.fs.snapshot(self.snapshot_dirs()))
+
+    @abstractmethod
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        """Run the check against a directory snapshot (see FileIndex.snapshot)."""
+        pass
@@ -2,12 +2,36 @@
 
 import re
 
-from rhc.checks.base import BaseCheck, CheckInfo
+from rhc.checks.base import BaseCheck, CheckInfo, SnapshotCheck
 from rhc.context import Context
 from rhc.types import Category, Evidence, Finding, Severity
 
-
-class CIConfigPresentCheck(BaseCheck):
+# GitHub Actions workflows live in one directory and are detected by suffix
+WORKFLOWS_DIR = ".github/workflows"
+WORKFLOW_SUFFIXES = (".yml", ".yaml")
+
+# Config files for the other CI providers
+CI_CONFIGS = {
+    "GitLab CI": (".gitlab-ci.yml",),
+    "CircleCI": (".circleci/config.yml",),
+    "Travis CI": (".travis.yml",),
+    "Azure Pipelines": ("azure-pipelines.yml",),
+    "Jenkins": ("Jenkinsfile",),
+}
+
+# Common badge patterns (shields.io, GitHub Actions, codecov, coveralls), fused into
+# one alternation so the README is scanned in a single pass. Matched against the
+# lowercased README, so the pattern itself must stay lowercase.
+BADGE_RE = re.compile(
+    r"!\[[^\]]*\]\(https?://"
+    r"(?:[^)]*(?:shields\.io|badge)"
+    r"|github\.com/[^)]*/(?:workflows|actions)"
+    r"|codecov\.io"
+    r"|coveralls\.io)"
+)
+
+
+class CIConfigPresentCheck(SnapshotCheck):
     """Check for CI/CD configuration presence."""
 
     info = CheckInfo(
@@ -33,37 +57,30 @@ Evidence: Lists CI providers found or notes absence.""",
         default_weight=-10,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        ci_configs = {
-            "GitHub Actions": [".github/workflows/*.yml", ".github/workflows/*.yaml"],
-            "GitLab CI": [".gitlab-ci.yml"],
-            "CircleCI": [".circleci/config.yml"],
-            "Travis CI": [".travis.yml"],
-            "Azure Pipelines": ["azure-pipelines.yml"],
-            "Jenkins": ["Jenkinsfile"],
-        }
-
-        found_providers = []
-        for provider, patterns in ci_configs.items():
-            for pattern in patterns:
-                if ctx.fs.exists(pattern):
-                    found_providers.append(provider)
-                    break
-
-        if found_providers:
+    wants_files = frozenset(path for paths in CI_CONFIGS.values() for path in paths)
+    wants_dirs = frozenset({WORKFLOWS_DIR})
+
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if not snapshot.isdisjoint(self.wants_files):
             return []
 
+        # GitHub Actions: any workflow file in the listed workflows directory
+        workflows_prefix = f"{WORKFLOWS_DIR}/"
+        for path in snapshot:
+            if path.startswith(workflows_prefix) and path.endswith(WORKFLOW_SUFFIXES):
+                return []
+
         return [
             Finding(
                 id=self.info.id,
                 title="No CI/CD configuration found",
                 severity=Severity.HIGH,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[
                     Evidence(
                         description="No CI/CD configuration files detected",
-                        details={"searched_providers": list(ci_configs.keys())},
+                        details={"searched_providers": ["GitHub Actions", *CI_CONFIGS]},
                     )
                 ],
                 recommendation="Set up CI/CD. For GitHub, create .github/workflows/ci.yml",
@@ -96,32 +113,13 @@ Evidence: Lists badge patterns found or notes absence.""",
     )
 
     def run(self, ctx: Context) -> list[Finding]:
-        readme_patterns = ["README.md", "README.rst", "README", "readme.md"]
-
-        readme_content = None
-        for pattern in readme_patterns:
-            files = list(ctx.fs.glob(pattern))
-            if files:
-                readme_content = ctx.fs.read_text_safe(files[0])
-                break
-
+        readme_content = ctx.readme_text
         if not readme_content:
             # No README, skip this check (README check will catch it)
             return []
 
-        # Common badge patterns
-        badge_patterns = [
-            r"!\[.*\]\(https?://.*shields\.io",
-            r"!\[.*\]\(https?://.*badge",
-            r"!\[.*\]\(https?://github\.com/.*/(workflows|actions)",
-            r"!\[.*\]\(https?://codecov\.io",
-            r"!\[.*\]\(https?://coveralls\.io",
-            r"!\[.*\]\(https?://img\.shields\.io",
-        ]
-
-        for pattern in badge_patterns:
-            if re.search(pattern, readme_content, re.IGNORECASE):
-                return []
+        if BADGE_RE.search(readme_content.lower()):
+            return []
 
         return [
             Finding(
@@ -129,7 +127,7 @@ Evidence: Lists badge patterns found or notes absence.""",
                 title="No status badges in README",
                 severity=Severity.INFO,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="README does not contain recognizable status badges")],
                 recommendation="Add status badges (build, coverage, version) to README for quick health visibility.",
             )
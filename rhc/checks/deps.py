@@ -2,12 +2,48 @@
 
 import time
 
-from rhc.checks.base import BaseCheck, CheckInfo
+from rhc.checks.base import BaseCheck, CheckInfo, SnapshotCheck
 from rhc.context import Context
 from rhc.types import Category, Evidence, Finding, Severity
 
-
-class LockfilePresentCheck(BaseCheck):
+# Package manifests; a lockfile is only expected when one of these exists
+MANIFESTS = frozenset(
+    {
+        "package.json",
+        "pyproject.toml",
+        "setup.py",
+        "requirements.txt",
+        "Pipfile",
+        "go.mod",
+        "Cargo.toml",
+        "Gemfile",
+        "composer.json",
+    }
+)
+
+# Lockfiles per package manager; a repo should use at most one manager per group
+JS_LOCKFILES = {
+    "npm": "package-lock.json",
+    "yarn": "yarn.lock",
+    "pnpm": "pnpm-lock.yaml",
+}
+PY_LOCKFILES = {
+    "poetry": "poetry.lock",
+    "pipenv": "Pipfile.lock",
+    "uv": "uv.lock",
+    "pdm": "pdm.lock",
+}
+OTHER_LOCKFILES = ("go.sum", "Cargo.lock", "Gemfile.lock", "composer.lock")
+
+# Every known lockfile (ordered, reported as evidence)
+LOCKFILES = (*JS_LOCKFILES.values(), *PY_LOCKFILES.values(), *OTHER_LOCKFILES)
+
+# Lockfile age thresholds for freshness hints
+SIX_MONTHS_SEC = 180 * 24 * 60 * 60
+ONE_YEAR_SEC = 365 * 24 * 60 * 60
+
+
+class LockfilePresentCheck(SnapshotCheck):
     """Check for dependency lockfile presence."""
 
     info = CheckInfo(
@@ -35,42 +71,17 @@ Evidence: Lists lockfiles found or notes absence.""",
         default_weight=-6,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        # Check if there are any package manifests first
-        manifests = [
-            "package.json",
-            "pyproject.toml",
-            "setup.py",
-            "requirements.txt",
-            "Pipfile",
-            "go.mod",
-            "Cargo.toml",
-            "Gemfile",
-            "composer.json",
-        ]
+    wants_files = MANIFESTS | frozenset(LOCKFILES)
 
-        has_manifest = any(ctx.fs.exists(m) for m in manifests)
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        # Check if there are any package manifests first
+        has_manifest = not snapshot.isdisjoint(MANIFESTS)
         if not has_manifest:
             # No package manager detected, skip this check
             return []
 
-        lockfiles = [
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            "poetry.lock",
-            "Pipfile.lock",
-            "uv.lock",
-            "pdm.lock",
-            "go.sum",
-            "Cargo.lock",
-            "Gemfile.lock",
-            "composer.lock",
-        ]
-
-        for lockfile in lockfiles:
-            if ctx.fs.exists(lockfile):
-                return []
+        if not snapshot.isdisjoint(LOCKFILES):
+            return []
 
         return [
             Finding(
@@ -78,11 +89,11 @@ Evidence: Lists lockfiles found or notes absence.""",
                 title="No dependency lockfile found",
                 severity=Severity.MEDIUM,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[
                     Evidence(
                         description="Package manifest found but no lockfile",
-                        details={"searched_lockfiles": lockfiles},
+                        details={"searched_lockfiles": list(LOCKFILES)},
                     )
                 ],
                 recommendation="Generate a lockfile (npm install, poetry lock, cargo build) and commit it.",
@@ -110,28 +121,18 @@ Evidence: Reports lockfile age if concerning.""",
     )
 
     def run(self, ctx: Context) -> list[Finding]:
-        lockfiles = [
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            "poetry.lock",
-            "Pipfile.lock",
-            "uv.lock",
-            "go.sum",
-            "Cargo.lock",
-            "Gemfile.lock",
-            "composer.lock",
-        ]
-
-        six_months_ago = time.time() - (180 * 24 * 60 * 60)
-        one_year_ago = time.time() - (365 * 24 * 60 * 60)
-
-        for lockfile_name in lockfiles:
-            files = list(ctx.fs.glob(lockfile_name))
-            if not files:
+        now = time.time()
+        six_months_ago = now - SIX_MONTHS_SEC
+        one_year_ago = now - ONE_YEAR_SEC
+
+        # Only stat lockfiles that the root listing says are present
+        names = ctx.fs.root_names()
+        for lockfile_name in LOCKFILES:
+            if lockfile_name not in names:
                 continue
 
-            stats = ctx.fs.file_stats(files[0])
+            lockfile_path = ctx.fs.root / lockfile_name
+            stats = ctx.fs.file_stats(lockfile_path)
             if not stats:
                 continue
 
@@ -142,11 +143,11 @@ Evidence: Reports lockfile age if concerning.""",
                         title="Lockfile appears very outdated",
                         severity=Severity.MEDIUM,
                         category=self.info.category,
-                        score_impact=self.get_weight(ctx.config.checks.weights),
+                        score_impact=ctx.resolved_weight(self.info),
                         evidence=[
                             Evidence(
                                 description=f"{lockfile_name} was last modified over 12 months ago",
-                                files=[str(files[0])],
+                                files=[str(lockfile_path)],
                             )
                         ],
                         recommendation="Run `npm update`, `poetry update`, or equivalent to refresh dependencies.",
@@ -163,7 +164,7 @@ Evidence: Reports lockfile age if concerning.""",
                         evidence=[
                             Evidence(
                                 description=f"{lockfile_name} was last modified over 6 months ago",
-                                files=[str(files[0])],
+                                files=[str(lockfile_path)],
                             )
                         ],
                         recommendation="Consider updating dependencies periodically for security patches.",
@@ -196,14 +197,10 @@ Evidence: Lists conflicting package managers found.""",
     )
 
     def run(self, ctx: Context) -> list[Finding]:
-        # JavaScript package manager conflicts
-        js_managers = {
-            "npm": "package-lock.json",
-            "yarn": "yarn.lock",
-            "pnpm": "pnpm-lock.yaml",
-        }
+        names = ctx.fs.root_names()
 
-        js_found = [name for name, lock in js_managers.items() if ctx.fs.exists(lock)]
+        # JavaScript package manager conflicts
+        js_found = [name for name, lock in JS_LOCKFILES.items() if lock in names]
 
         if len(js_found) > 1:
             return [
@@ -212,7 +209,7 @@ Evidence: Lists conflicting package managers found.""",
                     title="Multiple JavaScript package managers detected",
                     severity=Severity.MEDIUM,
                     category=self.info.category,
-                    score_impact=self.get_weight(ctx.config.checks.weights),
+                    score_impact=ctx.resolved_weight(self.info),
                     evidence=[
                         Evidence(
                             description=f"Found lockfiles for: {', '.join(js_found)}",
@@ -224,14 +221,7 @@ Evidence: Lists conflicting package managers found.""",
             ]
 
         # Python package manager conflicts
-        py_managers = {
-            "poetry": "poetry.lock",
-            "pipenv": "Pipfile.lock",
-            "uv": "uv.lock",
-            "pdm": "pdm.lock",
-        }
-
-        py_found = [name for name, lock in py_managers.items() if ctx.fs.exists(lock)]
+        py_found = [name for name, lock in PY_LOCKFILES.items() if lock in names]
 
         if len(py_found) > 1:
             return [
@@ -240,7 +230,7 @@ Evidence: Lists conflicting package managers found.""",
                     title="Multiple Python package managers detected",
                     severity=Severity.MEDIUM,
                     category=self.info.category,
-                    score_impact=self.get_weight(ctx.config.checks.weights),
+                    score_impact=ctx.resolved_weight(self.info),
                     evidence=[
                         Evidence(
                             description=f"Found lockfiles for: {', '.join(py_found)}",
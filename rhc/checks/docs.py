@@ -1,11 +1,24 @@
 """Documentation checks."""
 
-from rhc.checks.base import BaseCheck, CheckInfo
-from rhc.context import Context
+from rhc.checks.base import CheckInfo, SnapshotCheck
+from rhc.context import README_NAMES, Context
 from rhc.types import Category, Evidence, Finding, Severity
 
-
-class ReadmePresentCheck(BaseCheck):
+# Accepted file names per document
+LICENSE_PATTERNS = (
+    "LICENSE",
+    "LICENSE.md",
+    "LICENSE.txt",
+    "LICENCE",
+    "LICENCE.md",
+    "license",
+    "license.md",
+)
+CONTRIBUTING_PATTERNS = ("CONTRIBUTING", "CONTRIBUTING.md", ".github/CONTRIBUTING.md")
+SECURITY_POLICY_PATTERNS = ("SECURITY.md", ".github/SECURITY.md", "SECURITY")
+
+
+class ReadmePresentCheck(SnapshotCheck):
     """Check for README file presence."""
 
     info = CheckInfo(
@@ -26,13 +39,11 @@ Evidence: Lists the README file found or notes its absence.""",
         default_weight=-6,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        patterns = ["README", "README.md", "README.rst", "README.txt", "readme.md", "Readme.md"]
+    wants_files = frozenset(README_NAMES)
 
-        for pattern in patterns:
-            files = list(ctx.fs.glob(pattern))
-            if files:
-                return []  # README found, no issue
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if not snapshot.isdisjoint(self.wants_files):
+            return []  # README found, no issue
 
         return [
             Finding(
@@ -40,14 +51,14 @@ Evidence: Lists the README file found or notes its absence.""",
                 title="Missing README",
                 severity=Severity.HIGH,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No README file found in repository root")],
                 recommendation="Create a README.md with project overview, installation, and usage instructions.",
             )
         ]
 
 
-class LicensePresentCheck(BaseCheck):
+class LicensePresentCheck(SnapshotCheck):
     """Check for LICENSE file presence."""
 
     info = CheckInfo(
@@ -67,21 +78,11 @@ Evidence: Lists the LICENSE file found or notes its absence.""",
         default_weight=-4,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        patterns = [
-            "LICENSE",
-            "LICENSE.md",
-            "LICENSE.txt",
-            "LICENCE",
-            "LICENCE.md",
-            "license",
-            "license.md",
-        ]
+    wants_files = frozenset(LICENSE_PATTERNS)
 
-        for pattern in patterns:
-            files = list(ctx.fs.glob(pattern))
-            if files:
-                return []
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if not snapshot.isdisjoint(self.wants_files):
+            return []
 
         return [
             Finding(
@@ -89,14 +90,14 @@ Evidence: Lists the LICENSE file found or notes its absence.""",
                 title="Missing LICENSE",
                 severity=Severity.MEDIUM,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No LICENSE file found in repository root")],
                 recommendation="Add a LICENSE file. Use https://choosealicense.com/ to select an appropriate license.",
             )
         ]
 
 
-class ContributingPresentCheck(BaseCheck):
+class ContributingPresentCheck(SnapshotCheck):
     """Check for CONTRIBUTING file presence."""
 
     info = CheckInfo(
@@ -116,13 +117,11 @@ Evidence: Lists the file found or notes its absence.""",
         default_weight=-3,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        patterns = ["CONTRIBUTING", "CONTRIBUTING.md", ".github/CONTRIBUTING.md"]
+    wants_files = frozenset(CONTRIBUTING_PATTERNS)
 
-        for pattern in patterns:
-            files = list(ctx.fs.glob(pattern))
-            if files:
-                return []
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if not snapshot.isdisjoint(self.wants_files):
+            return []
 
         return [
             Finding(
@@ -130,14 +129,14 @@ Evidence: Lists the file found or notes its absence.""",
                 title="Missing CONTRIBUTING guide",
                 severity=Severity.LOW,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No CONTRIBUTING file found")],
                 recommendation="Add a CONTRIBUTING.md describing how to contribute, code style, and PR process.",
             )
         ]
 
 
-class SecurityPolicyPresentCheck(BaseCheck):
+class SecurityPolicyPresentCheck(SnapshotCheck):
     """Check for SECURITY policy file presence."""
 
     info = CheckInfo(
@@ -157,13 +156,11 @@ Evidence: Lists the file found or notes its absence.""",
         default_weight=-3,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        patterns = ["SECURITY.md", ".github/SECURITY.md", "SECURITY"]
+    wants_files = frozenset(SECURITY_POLICY_PATTERNS)
 
-        for pattern in patterns:
-            files = list(ctx.fs.glob(pattern))
-            if files:
-                return []
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if not snapshot.isdisjoint(self.wants_files):
+            return []
 
         return [
             Finding(
@@ -171,7 +168,7 @@ Evidence: Lists the file found or notes its absence.""",
                 title="Missing Security Policy",
                 severity=Severity.LOW,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No SECURITY.md file found")],
                 recommendation="Add a SECURITY.md with vulnerability reporting instructions.",
             )
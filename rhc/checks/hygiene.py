@@ -2,12 +2,31 @@
 
 import re
 
-from rhc.checks.base import BaseCheck, CheckInfo
+from rhc.checks.base import BaseCheck, CheckInfo, SnapshotCheck
 from rhc.context import Context
 from rhc.types import Category, Evidence, Finding, Severity
 
-
-class GitignorePresentCheck(BaseCheck):
+# Semver-style tag, with or without a "v" prefix
+SEMVER_RE = re.compile(r"^v?\d+\.\d+\.\d+")
+
+# Accepted changelog file names
+CHANGELOG_PATTERNS = frozenset(
+    {
+        "CHANGELOG.md",
+        "CHANGELOG",
+        "CHANGELOG.txt",
+        "HISTORY.md",
+        "HISTORY",
+        "CHANGES.md",
+        "CHANGES",
+        "NEWS.md",
+        "NEWS",
+        "changelog.md",
+    }
+)
+
+
+class GitignorePresentCheck(SnapshotCheck):
     """Check for .gitignore file."""
 
     info = CheckInfo(
@@ -26,8 +45,10 @@ Evidence: Notes .gitignore presence or absence.""",
         default_weight=-4,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        if ctx.fs.exists(".gitignore"):
+    wants_files = frozenset({".gitignore"})
+
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if ".gitignore" in snapshot:
             return []
 
         return [
@@ -36,14 +57,14 @@ Evidence: Notes .gitignore presence or absence.""",
                 title="Missing .gitignore",
                 severity=Severity.MEDIUM,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No .gitignore file found")],
                 recommendation="Add a .gitignore file. Use gitignore.io to generate one for your stack.",
             )
         ]
 
 
-class EditorconfigPresentCheck(BaseCheck):
+class EditorconfigPresentCheck(SnapshotCheck):
     """Check for .editorconfig file."""
 
     info = CheckInfo(
@@ -62,8 +83,10 @@ Evidence: Notes .editorconfig presence or absence.""",
         default_weight=-2,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        if ctx.fs.exists(".editorconfig"):
+    wants_files = frozenset({".editorconfig"})
+
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if ".editorconfig" in snapshot:
             return []
 
         return [
@@ -72,7 +95,7 @@ Evidence: Notes .editorconfig presence or absence.""",
                 title="Missing .editorconfig",
                 severity=Severity.INFO,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No .editorconfig file found")],
                 recommendation="Add an .editorconfig file for consistent formatting across editors.",
             )
@@ -113,24 +136,21 @@ Evidence: Lists version tags found or notes absence.""",
                     title="No version tags found",
                     severity=Severity.LOW,
                     category=self.info.category,
-                    score_impact=self.get_weight(ctx.config.checks.weights),
+                    score_impact=ctx.resolved_weight(self.info),
                     evidence=[Evidence(description="No git tags found")],
                     recommendation="Use semantic versioning tags (v1.0.0) for releases.",
                 )
             ]
 
         # Check for semver pattern
-        semver_pattern = r"^v?\d+\.\d+\.\d+"
-        semver_tags = [t for t in ctx.git.tags if re.match(semver_pattern, t)]
-
-        if not semver_tags:
+        if not any(SEMVER_RE.match(t) for t in ctx.git.tags):
             return [
                 Finding(
                     id=self.info.id,
                     title="No semver tags found",
                     severity=Severity.LOW,
                     category=self.info.category,
-                    score_impact=self.get_weight(ctx.config.checks.weights),
+                    score_impact=ctx.resolved_weight(self.info),
                     evidence=[
                         Evidence(
                             description=f"Found {len(ctx.git.tags)} tags but none follow semver",
@@ -144,7 +164,7 @@ Evidence: Lists version tags found or notes absence.""",
         return []
 
 
-class ChangelogPresentCheck(BaseCheck):
+class ChangelogPresentCheck(SnapshotCheck):
     """Check for CHANGELOG file."""
 
     info = CheckInfo(
@@ -168,23 +188,11 @@ Evidence: Notes changelog presence or absence.""",
         default_weight=-3,
     )
 
-    def run(self, ctx: Context) -> list[Finding]:
-        changelog_patterns = [
-            "CHANGELOG.md",
-            "CHANGELOG",
-            "CHANGELOG.txt",
-            "HISTORY.md",
-            "HISTORY",
-            "CHANGES.md",
-            "CHANGES",
-            "NEWS.md",
-            "NEWS",
-            "changelog.md",
-        ]
+    wants_files = CHANGELOG_PATTERNS
 
-        for pattern in changelog_patterns:
-            if ctx.fs.exists(pattern):
-                return []
+    def run_from_snapshot(self, ctx: Context, snapshot: frozenset[str]) -> list[Finding]:
+        if not snapshot.isdisjoint(self.wants_files):
+            return []
 
         return [
             Finding(
@@ -192,7 +200,7 @@ Evidence: Notes changelog presence or absence.""",
                 title="Missing CHANGELOG",
                 severity=Severity.LOW,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No changelog file found")],
                 recommendation="Add a CHANGELOG.md following https://keepachangelog.com/ format.",
             )
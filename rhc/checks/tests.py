@@ -2,10 +2,136 @@
 
 import re
 
+import yaml
+
 from rhc.checks.base import BaseCheck, CheckInfo
 from rhc.context import Context
 from rhc.types import Category, Evidence, Finding, Severity
 
+# Conventional test directory names
+TEST_DIRS = ("tests", "test", "spec", "__tests__", "specs")
+
+# Test file naming conventions per language
+TEST_FILE_PATTERNS = (
+    "**/*_test.py",
+    "**/test_*.py",
+    "**/*.test.js",
+    "**/*.spec.js",
+    "**/*.test.ts",
+    "**/*.spec.ts",
+    "**/*_test.go",
+    "**/Test*.java",
+    "**/*Test.java",
+    "**/*_spec.rb",
+)
+
+# CI configuration files inspected for test commands
+CI_FILE_PATTERNS = (
+    ".github/workflows/*.yml",
+    ".github/workflows/*.yaml",
+    ".gitlab-ci.yml",
+    ".circleci/config.yml",
+    ".travis.yml",
+)
+
+# Commands in CI configuration that indicate tests are run
+CI_TEST_PATTERNS = (
+    r"\bpytest\b",
+    r"\bnpm\s+test\b",
+    r"\byarn\s+test\b",
+    r"\bgo\s+test\b",
+    r"\bcargo\s+test\b",
+    r"\bmvn\s+test\b",
+    r"\bgradle\s+test\b",
+    r"\brspec\b",
+    r"\bphpunit\b",
+    r"run:\s*['\"]?test",
+    r"script:\s*['\"]?test",
+    r"\bcoverage\b",
+    r"\bjest\b",
+    r"\bmocha\b",
+    r"\bvitest\b",
+)
+# All CI test patterns as one case-insensitive alternation
+CI_TEST_RE = re.compile("|".join(CI_TEST_PATTERNS), re.IGNORECASE)
+
+# Directory holding GitHub Actions workflows
+WORKFLOWS_DIR = ".github/workflows"
+
+
+def workflow_commands(content: str) -> list[str] | None:
+    """Extract what the jobs of a GitHub Actions workflow execute.
+
+    Each entry keeps its key, e.g. ``"run: pytest -q"``: step ``run``
+    commands, job and step ``uses`` references, and the string inputs a step
+    passes ``with``. Returns None when the content is not a parseable
+    workflow or has no ``run`` step, so callers can fall back to scanning
+    the raw text.
+    """
+    try:
+        data = yaml.safe_load(content)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("jobs"), dict):
+        return None
+
+    commands: list[str] = []
+    has_run = False
+    for job in data["jobs"].values():
+        if not isinstance(job, dict):
+            continue
+        if isinstance(job.get("uses"), str):  # reusable workflow
+            commands.append(f"uses: {job['uses']}")
+        for step in job.get("steps") or ():
+            if not isinstance(step, dict):
+                continue
+            if isinstance(step.get("run"), str):
+                commands.append(f"run: {step['run']}")
+                has_run = True
+            if isinstance(step.get("uses"), str):
+                commands.append(f"uses: {step['uses']}")
+            if isinstance(step.get("with"), dict):
+                commands.extend(
+                    f"{key}: {value}" for key, value in step["with"].items() if isinstance(value, str)
+                )
+    return commands if has_run else None
+
+
+# Linter and formatter configuration files (all top-level)
+LINTER_CONFIGS = frozenset(
+    {
+        # Python
+        "ruff.toml",
+        ".ruff.toml",
+        ".flake8",
+        ".pylintrc",
+        "pylintrc",
+        ".mypy.ini",
+        "mypy.ini",
+        # JavaScript/TypeScript
+        ".eslintrc",
+        ".eslintrc.js",
+        ".eslintrc.json",
+        ".eslintrc.yml",
+        ".prettierrc",
+        ".prettierrc.js",
+        ".prettierrc.json",
+        "biome.json",
+        # Go
+        ".golangci.yml",
+        ".golangci.yaml",
+        # Rust
+        "rustfmt.toml",
+        ".rustfmt.toml",
+        "clippy.toml",
+        # Ruby
+        ".rubocop.yml",
+        # PHP
+        ".php-cs-fixer.php",
+        "phpcs.xml",
+    }
+)
+
 
 class TestsDetectedCheck(BaseCheck):
     """Check if tests are present in the repository."""
@@ -33,30 +159,9 @@ Evidence: Lists test directories/files found or notes absence.""",
     )
 
     def run(self, ctx: Context) -> list[Finding]:
-        # Test directories
-        test_dirs = ["tests", "test", "spec", "__tests__", "specs"]
-        for dir_name in test_dirs:
-            if ctx.fs.exists(dir_name):
-                return []
-
-        # Test file patterns
-        test_patterns = [
-            "**/*_test.py",
-            "**/test_*.py",
-            "**/*.test.js",
-            "**/*.spec.js",
-            "**/*.test.ts",
-            "**/*.spec.ts",
-            "**/*_test.go",
-            "**/Test*.java",
-            "**/*Test.java",
-            "**/*_spec.rb",
-        ]
-
-        for pattern in test_patterns:
-            files = list(ctx.fs.glob(pattern))
-            if files:
-                return []
+        # Test directories, then test files (each probe stops at the first hit)
+        if ctx.fs.exists(*TEST_DIRS) or ctx.fs.exists(*TEST_FILE_PATTERNS):
+            return []
 
         return [
             Finding(
@@ -64,11 +169,11 @@ Evidence: Lists test directories/files found or notes absence.""",
                 title="No tests detected",
                 severity=Severity.HIGH,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[
                     Evidence(
                         description="No test files or directories found",
-                        details={"searched_dirs": test_dirs},
+                        details={"searched_dirs": list(TEST_DIRS)},
                     )
                 ],
                 recommendation="Add tests. Create a tests/ directory and write unit tests for core functionality.",
@@ -90,6 +195,9 @@ Searches CI configs for patterns like:
 - test step keywords
 - coverage commands
 
+GitHub Actions workflows are parsed and only step run commands, action and
+reusable workflow references, and step inputs are searched.
+
 Running tests in CI ensures:
 - Tests are not skipped locally
 - All PRs are validated
@@ -101,43 +209,27 @@ Evidence: Lists test commands found or notes absence.""",
 
     def run(self, ctx: Context) -> list[Finding]:
         # Find CI files
-        ci_files = list(ctx.fs.glob(".github/workflows/*.yml")) + list(
-            ctx.fs.glob(".github/workflows/*.yaml")
-        )
-        ci_files.extend(list(ctx.fs.glob(".gitlab-ci.yml")))
-        ci_files.extend(list(ctx.fs.glob(".circleci/config.yml")))
-        ci_files.extend(list(ctx.fs.glob(".travis.yml")))
+        ci_files = ctx.fs.find_files(*CI_FILE_PATTERNS)
 
         if not ci_files:
             # No CI, skip (CI check will catch it)
             return []
 
-        test_patterns = [
-            r"\bpytest\b",
-            r"\bnpm\s+test\b",
-            r"\byarn\s+test\b",
-            r"\bgo\s+test\b",
-            r"\bcargo\s+test\b",
-            r"\bmvn\s+test\b",
-            r"\bgradle\s+test\b",
-            r"\brspec\b",
-            r"\bphpunit\b",
-            r"run:\s*['\"]?test",
-            r"script:\s*['\"]?test",
-            r"\bcoverage\b",
-            r"\bjest\b",
-            r"\bmocha\b",
-            r"\bvitest\b",
-        ]
-
         for ci_file in ci_files:
             content = ctx.fs.read_text_safe(ci_file)
             if not content:
                 continue
 
-            for pattern in test_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return []
+            # GitHub workflows: only what the jobs execute can run tests
+            if ci_file.parent == ctx.fs.root / WORKFLOWS_DIR:
+                commands = workflow_commands(content)
+                if commands is not None:
+                    if any(CI_TEST_RE.search(command) for command in commands):
+                        return []
+                    continue
+
+            if CI_TEST_RE.search(content):
+                return []
 
         return [
             Finding(
@@ -145,7 +237,7 @@ Evidence: Lists test commands found or notes absence.""",
                 title="CI does not appear to run tests",
                 severity=Severity.MEDIUM,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[
                     Evidence(
                         description="CI configuration files don't contain recognizable test commands",
@@ -182,46 +274,13 @@ Evidence: Lists linter configs found or notes absence.""",
     )
 
     def run(self, ctx: Context) -> list[Finding]:
-        linter_configs = [
-            # Python
-            "ruff.toml",
-            ".ruff.toml",
-            ".flake8",
-            ".pylintrc",
-            "pylintrc",
-            ".mypy.ini",
-            "mypy.ini",
-            # JavaScript/TypeScript
-            ".eslintrc",
-            ".eslintrc.js",
-            ".eslintrc.json",
-            ".eslintrc.yml",
-            ".prettierrc",
-            ".prettierrc.js",
-            ".prettierrc.json",
-            "biome.json",
-            # Go
-            ".golangci.yml",
-            ".golangci.yaml",
-            # Rust
-            "rustfmt.toml",
-            ".rustfmt.toml",
-            "clippy.toml",
-            # Ruby
-            ".rubocop.yml",
-            # PHP
-            ".php-cs-fixer.php",
-            "phpcs.xml",
-        ]
-
-        for config in linter_configs:
-            if ctx.fs.exists(config):
-                return []
+        if not ctx.fs.root_names().isdisjoint(LINTER_CONFIGS):
+            return []
 
         # Check pyproject.toml for [tool.ruff] or similar
-        pyproject = list(ctx.fs.glob("pyproject.toml"))
+        pyproject = ctx.fs.first_match("pyproject.toml")
         if pyproject:
-            content = ctx.fs.read_text_safe(pyproject[0])
+            content = ctx.fs.read_text_safe(pyproject)
             if content and "[tool.ruff]" in content:
                 return []
             if content and "[tool.black]" in content:
@@ -230,9 +289,9 @@ Evidence: Lists linter configs found or notes absence.""",
                 return []
 
         # Check package.json for eslint config
-        package_json = list(ctx.fs.glob("package.json"))
+        package_json = ctx.fs.first_match("package.json")
         if package_json:
-            content = ctx.fs.read_text_safe(package_json[0])
+            content = ctx.fs.read_text_safe(package_json)
             if content and '"eslintConfig"' in content:
                 return []
 
@@ -242,7 +301,7 @@ Evidence: Lists linter configs found or notes absence.""",
                 title="No linter/formatter configured",
                 severity=Severity.MEDIUM,
                 category=self.info.category,
-                score_impact=self.get_weight(ctx.config.checks.weights),
+                score_impact=ctx.resolved_weight(self.info),
                 evidence=[Evidence(description="No linter configuration files found")],
                 recommendation="Configure a linter (ruff for Python, ESLint for JS/TS, golangci-lint for Go).",
             )
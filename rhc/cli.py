@@ -1,4 +1,8 @@
-"""CLI entry point for RHC."""
+"""CLI entry point for RHC.
+
+Commands import what they need when they run, so ``rhc --version`` and
+``rhc init`` do not pay for loading the scanner, checks and renderers.
+"""
 
 import sys
 from pathlib import Path
@@ -6,12 +10,6 @@ from pathlib import Path
 import click
 
 from rhc import __version__
-from rhc.checks import get_all_checks, get_check_by_id
-from rhc.config import Config, generate_example_config
-from rhc.renderers import get_renderer
-from rhc.scanner import scan
-from rhc.scoring import check_policy_violation
-from rhc.types import Severity
 
 # Exit codes
 EXIT_OK = 0
@@ -78,6 +76,12 @@ def scan_cmd(
 
     PATH is the repository path (default: current directory)
     """
+    from rhc.config import Config
+    from rhc.renderers import get_renderer
+    from rhc.scanner import scan
+    from rhc.scoring import check_policy_violation
+    from rhc.types import Severity
+
     try:
         repo_path = Path(path).resolve()
 
@@ -86,7 +90,7 @@ def scan_cmd(
             config_path=Path(config) if config else None,
             repo_path=repo_path,
         )
-        cfg.merge_cli_args(
+        cfg = cfg.merge_cli_args(
             fail_on=fail_on if fail_on != "none" else None,
             min_score=min_score,
             only=list(only) if only else None,
@@ -104,7 +108,8 @@ def scan_cmd(
         report = scan(repo_path, cfg)
 
         # Render output
-        renderer = get_renderer(format, plain=plain)
+        # Colors only for the terminal (click strips them when piped)
+        renderer = get_renderer(format, plain=plain, color=output is None)
         result = renderer.render(report)
 
         # Write output
@@ -150,6 +155,8 @@ main.add_command(scan_cmd, name="scan")
 @main.command("list-checks")
 def list_checks() -> None:
     """List all available health checks."""
+    from rhc.checks import get_all_checks
+
     checks = get_all_checks()
 
     click.echo("\nAvailable Checks:\n")
@@ -171,6 +178,8 @@ def explain(check_id: str) -> None:
 
     CHECK_ID is the check identifier (e.g., DOC.README_PRESENT)
     """
+    from rhc.checks import get_check_by_id
+
     check = get_check_by_id(check_id)
 
     if not check:
@@ -185,6 +194,8 @@ def explain(check_id: str) -> None:
 @click.option("--output", "-o", type=click.Path(), default=".rhc.yml", help="Output file path")
 def init(output: str) -> None:
     """Create an example .rhc.yml configuration file."""
+    from rhc.config import generate_example_config
+
     output_path = Path(output)
 
     if output_path.exists():
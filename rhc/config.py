@@ -1,16 +1,33 @@
 """Configuration loading and management."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from rhc.types import Severity
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 DEFAULT_CONFIG_FILENAME = ".rhc.yml"
 
+# Severity lookup by config value; unknown values are ignored
+SEVERITY_BY_VALUE = {severity.value: severity for severity in Severity}
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, cached until its mtime or size changes."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PolicyConfig:
     """Policy configuration for the scan."""
 
@@ -18,18 +35,24 @@ class PolicyConfig:
     fail_on: Severity | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChecksConfig:
     """Configuration for individual checks."""
 
-    skip: list[str] = field(default_factory=list)
-    only: list[str] = field(default_factory=list)
-    weights: dict[str, int] = field(default_factory=dict)
+    skip: tuple[str, ...] = ()
+    only: tuple[str, ...] = ()
+    # Left out of the hash: a dict is unhashable, and equal configs still hash equal
+    weights: dict[str, int] = field(default_factory=dict, hash=False)
+    parallel: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Complete configuration for RHC."""
+    """Complete configuration for RHC.
+
+    Configs are immutable and hashable; use ``dataclasses.replace`` (or
+    ``merge_cli_args``) to derive a changed one.
+    """
 
     version: int = 1
     policy: PolicyConfig = field(default_factory=PolicyConfig)
@@ -37,6 +60,8 @@ class Config:
     strict: bool = False
     offline: bool = True  # Default to offline
     debug: bool = False
+    # Extra directory names to skip when indexing, on top of the built-in set
+    exclude_dirs: tuple[str, ...] = ()
 
     @classmethod
     def load(cls, config_path: Path | None = None, repo_path: Path | None = None) -> "Config":
@@ -61,30 +86,40 @@ class Config:
     def _load_from_file(cls, path: Path) -> "Config":
         """Load configuration from a YAML file."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            stat = path.stat()
+            data = _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size) or {}
         except Exception:
             return cls()
 
-        config = cls()
-        config.version = data.get("version", 1)
-
         # Parse policy
         policy_data = data.get("policy", {})
-        config.policy.min_score = policy_data.get("min_score")
-        if "fail_on" in policy_data:
-            try:
-                config.policy.fail_on = Severity(policy_data["fail_on"])
-            except ValueError:
-                pass
+        fail_on = policy_data.get("fail_on")
+        policy = PolicyConfig(
+            min_score=policy_data.get("min_score"),
+            fail_on=SEVERITY_BY_VALUE.get(fail_on) if isinstance(fail_on, str) else None,
+        )
 
         # Parse checks
         checks_data = data.get("checks", {})
-        config.checks.skip = checks_data.get("skip", [])
-        config.checks.only = checks_data.get("only", [])
-        config.checks.weights = checks_data.get("weights", {})
-
-        return config
+        # Copy, so the cached parse result is never mutated through the config
+        checks = ChecksConfig(
+            skip=tuple(checks_data.get("skip") or ()),
+            only=tuple(checks_data.get("only") or ()),
+            weights=dict(checks_data.get("weights") or {}),
+            parallel=bool(checks_data.get("parallel", True)),
+        )
+
+        # Only a list names directories; a scalar would be split into characters
+        exclude_dirs = data.get("exclude_dirs")
+        if not isinstance(exclude_dirs, list):
+            exclude_dirs = []
+
+        return cls(
+            version=data.get("version", 1),
+            policy=policy,
+            checks=checks,
+            exclude_dirs=tuple(str(name) for name in exclude_dirs),
+        )
 
     def merge_cli_args(
         self,
@@ -96,27 +131,31 @@ class Config:
         offline: bool = True,
         debug: bool = False,
     ) -> "Config":
-        """Merge CLI arguments into configuration (CLI takes precedence)."""
+        """Return the configuration with CLI arguments merged in (CLI takes precedence)."""
+        policy = self.policy
         if fail_on:
-            try:
-                self.policy.fail_on = Severity(fail_on)
-            except ValueError:
-                pass
+            severity = SEVERITY_BY_VALUE.get(fail_on)
+            if severity is not None:
+                policy = replace(policy, fail_on=severity)
 
         if min_score is not None:
-            self.policy.min_score = min_score
+            policy = replace(policy, min_score=min_score)
 
+        checks = self.checks
         if only:
-            self.checks.only = only
+            checks = replace(checks, only=tuple(only))
 
         if skip:
-            self.checks.skip = list(set(self.checks.skip + skip))
+            checks = replace(checks, skip=tuple(dict.fromkeys((*checks.skip, *skip))))
 
-        self.strict = strict
-        self.offline = offline
-        self.debug = debug
-
-        return self
+        return replace(
+            self,
+            policy=policy,
+            checks=checks,
+            strict=strict,
+            offline=offline,
+            debug=debug,
+        )
 
 
 def generate_example_config() -> str:
@@ -126,6 +165,12 @@ def generate_example_config() -> str:
 
 version: 1
 
+# Extra directories to skip when indexing the repository
+# (.git, node_modules, __pycache__, virtualenvs, build output and tool
+# caches are always skipped)
+# exclude_dirs:
+#   - third_party
+
 # Policy settings - when to fail the check
 policy:
   # Minimum acceptable score (0-100)
@@ -150,4 +195,7 @@ checks:
   # weights:
   #   DOC.README_PRESENT: -8
   #   CI.CONFIG_PRESENT: -10
+
+  # Run checks concurrently on a thread pool (default: true)
+  # parallel: false
 """
@@ -1,12 +1,53 @@
 """Context providers for repository analysis."""
 
+import os
+import posixpath
+import re
 import subprocess
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase, translate
+from functools import cached_property
 from pathlib import Path
-from typing import Iterator
+from stat import S_ISLNK
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 from rhc.config import Config
 
+try:  # optional in-process git (libgit2), see the "fast" extra
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+if TYPE_CHECKING:
+    from rhc.checks.base import CheckInfo
+
+# README file names, in order of preference when reading the README
+README_NAMES = ("README.md", "README.rst", "README", "README.txt", "readme.md", "Readme.md")
+
+
+# Directories whose contents are never counted or walked by the file index:
+# VCS internals, dependency trees, caches and build output
+PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "target",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+    }
+)
+
+
+def is_literal(pattern: str) -> bool:
+    """Check if a glob pattern has no wildcards, i.e. names exactly one path."""
+    return not any(c in pattern for c in "*?[")
+
 
 @dataclass
 class FileStats:
@@ -18,12 +59,83 @@ class FileStats:
 
 
 class FileIndex:
-    """File system index for efficient file operations."""
-
-    def __init__(self, root_path: Path, follow_symlinks: bool = False):
+    """File system index for efficient file operations.
+
+    Shared by checks running on several threads. Its caches are plain dicts
+    that only ever gain entries, and each entry is a pure function of the
+    (unchanging) tree, so a race on first lookup at worst computes the same
+    value twice; no lock is needed.
+    """
+
+    def __init__(
+        self,
+        root_path: Path,
+        follow_symlinks: bool = False,
+        prune_dirs: frozenset[str] = PRUNE_DIRS,
+    ):
         self.root = root_path.resolve()
+        # String form for os-level calls in the walkers, converted once
+        self.root_str = os.fspath(self.root)
         self.follow_symlinks = follow_symlinks
+        # Directory names the recursive walkers list but never descend into
+        self.prune_dirs = prune_dirs
         self._cache: dict[str, bool] = {}
+        self._listings: dict[str, frozenset[str]] = {}
+        self._globs: dict[str, list[Path]] = {}
+        self._file_count: int | None = None
+
+    def build_index(self, listing_depth: int = 2) -> None:
+        """Walk the tree once, counting files and keeping shallow listings.
+
+        The file count answers ``count_files()``; directories at most
+        ``listing_depth`` levels deep are kept as ``list_dir`` listings, which
+        covers the root and the CI/config directories checks look into.
+        Files under ``prune_dirs`` are not counted.
+        """
+        prune = self.prune_dirs
+        count = 0
+        pending = [("", 0)]
+        while pending:
+            subdir, depth = pending.pop()
+            entries = self._scandir(os.path.join(self.root_str, subdir))
+            if depth <= listing_depth:
+                self._listings.setdefault(subdir, frozenset(entry.name for entry in entries))
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                    if entry.name not in prune:
+                        name = f"{subdir}/{entry.name}" if subdir else entry.name
+                        pending.append((name, depth + 1))
+                elif entry.is_file() and (self.follow_symlinks or not entry.is_symlink()):
+                    count += 1
+        self._file_count = count
+
+    def list_dir(self, subdir: str = "") -> frozenset[str]:
+        """Names of the entries of a directory (relative to the root), listed once."""
+        names = self._listings.get(subdir)
+        if names is None:
+            try:
+                with os.scandir(self.root / subdir) as entries:
+                    names = frozenset(entry.name for entry in entries)
+            except OSError:
+                names = frozenset()
+            self._listings[subdir] = names
+        return names
+
+    def root_names(self) -> frozenset[str]:
+        """Names of all top-level entries, listed once and memoized."""
+        return self.list_dir("")
+
+    def snapshot(self, dirs: Iterable[str]) -> frozenset[str]:
+        """Relative paths of every entry in the given directories.
+
+        The root is ``""``; entries of nested directories are prefixed with the
+        directory, e.g. ``".github/CODEOWNERS"``.
+        """
+        paths: set[str] = set()
+        for subdir in dirs:
+            prefix = f"{subdir}/" if subdir else ""
+            paths.update(prefix + name for name in self.list_dir(subdir))
+        return frozenset(paths)
 
     def exists(self, *patterns: str) -> bool:
         """Check if any file matching the patterns exists."""
@@ -38,16 +150,133 @@ class FileIndex:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        result = any(self.root.glob(pattern))
+        dirname, basename = posixpath.split(pattern)
+        if is_literal(dirname) and "**" not in basename:
+            # Answered from the memoized listing of that one directory
+            names = self.list_dir(dirname)
+            suffix = basename[1:]
+            if is_literal(basename):
+                result = basename in names
+            elif basename.startswith("*") and is_literal(suffix):
+                result = any(name.endswith(suffix) for name in names)
+            else:
+                result = any(fnmatchcase(name, basename) for name in names)
+        elif pattern in self._globs:
+            result = bool(self._globs[pattern])
+        else:
+            result = any(self._iter_glob(pattern, skip_symlinks=False))
         self._cache[cache_key] = result
         return result
 
+    def _scandir(self, path: str) -> list[os.DirEntry[str]]:
+        """Entries of a directory, or an empty list if it cannot be listed."""
+        try:
+            with os.scandir(path) as entries:
+                return list(entries)
+        except OSError:
+            return []
+
+    def _walk_entries(self) -> Iterator[os.DirEntry[str]]:
+        """Yield every entry in the tree with os.scandir.
+
+        ``DirEntry`` caches its type, so no extra stat() is needed per entry.
+        Symlinked directories are only descended into with follow_symlinks;
+        directories in ``prune_dirs`` are yielded but not descended into.
+        """
+        prune = self.prune_dirs
+        pending = [self.root_str]
+        while pending:
+            for entry in self._scandir(pending.pop()):
+                yield entry
+                if entry.name not in prune and entry.is_dir(follow_symlinks=self.follow_symlinks):
+                    pending.append(entry.path)
+
+    def _match_entries(
+        self, pattern: str, skip_symlinks: bool
+    ) -> Iterator[os.DirEntry[str]] | None:
+        """Match a wildcard pattern against scandir entries, if its shape allows.
+
+        ``dir/*.ext`` lists one directory and ``**/name`` walks the tree once,
+        matching entry names with fnmatch and skipping symlinks from the
+        cached entry type. Returns None for shapes that need pathlib.
+        """
+        dirname, basename = posixpath.split(pattern)
+        if "**" not in pattern and is_literal(dirname):
+            entries: Iterable[os.DirEntry[str]] = self._scandir(os.path.join(self.root_str, dirname))
+        elif dirname == "**" and "**" not in basename:
+            entries = self._walk_entries()
+        else:
+            return None
+        return (
+            entry
+            for entry in entries
+            if fnmatchcase(entry.name, basename) and not (skip_symlinks and entry.is_symlink())
+        )
+
+    def _iter_glob(self, pattern: str, skip_symlinks: bool) -> Iterator[Path]:
+        """Match a wildcard pattern, with scandir where the pattern allows it."""
+        entries = self._match_entries(pattern, skip_symlinks)
+        if entries is None:
+            for path in self.root.glob(pattern):
+                if not (skip_symlinks and path.is_symlink()):
+                    yield path
+            return
+        for entry in entries:
+            yield Path(entry.path)
+
     def glob(self, pattern: str) -> Iterator[Path]:
-        """Glob for files matching pattern."""
-        for path in self.root.glob(pattern):
-            if not self.follow_symlinks and path.is_symlink():
-                continue
-            yield path
+        """Glob for files matching pattern.
+
+        Literal patterns skip pattern matching and directory iteration, and
+        cost one ``lstat`` unless they name a symlink.
+        Wildcard results are cached, since checks glob overlapping patterns
+        and the tree does not change during a scan.
+        """
+        if is_literal(pattern):
+            path = os.path.join(self.root_str, pattern)
+            try:
+                is_link = S_ISLNK(os.lstat(path).st_mode)
+            except OSError:
+                return
+            if not is_link or (self.follow_symlinks and os.path.exists(path)):
+                yield Path(path)
+            return
+        paths = self._globs.get(pattern)
+        if paths is None:
+            paths = self._globs[pattern] = list(
+                self._iter_glob(pattern, skip_symlinks=not self.follow_symlinks)
+            )
+        yield from paths
+
+    def walk_files(
+        self,
+        match: Callable[[str], bool],
+        prune_dirs: frozenset[str] = frozenset(),
+    ) -> Iterator[tuple[str, Path]]:
+        """Walk the tree once, yielding ``(relative path, path)`` of matching files.
+
+        ``match`` is called with each file name. Directories named in
+        ``prune_dirs`` are not descended into.
+        """
+        skip = len(os.path.join(self.root_str, ""))  # root plus trailing separator
+        for dirpath, dirnames, filenames in os.walk(self.root_str, followlinks=self.follow_symlinks):
+            if prune_dirs:
+                dirnames[:] = [d for d in dirnames if d not in prune_dirs]
+            prefix = dirpath[skip:].replace(os.sep, "/") + "/" if dirpath != self.root_str else ""
+            for name in filenames:
+                if not match(name):
+                    continue
+                path_str = f"{dirpath}{os.sep}{name}"
+                if not self.follow_symlinks and os.path.islink(path_str):
+                    continue
+                yield prefix + name, Path(path_str)
+
+    def first_match(self, pattern: str) -> Path | None:
+        """Return the first path matching the pattern, or None.
+
+        Wildcard patterns stop at the first hit instead of globbing everything.
+        """
+        return next(self.glob(pattern), None)
 
     def find_files(self, *patterns: str) -> list[Path]:
         """Find all files matching any of the patterns."""
@@ -57,33 +286,78 @@ class FileIndex:
         return files
 
     def read_text_safe(self, path: Path, max_size: int = 1024 * 1024) -> str | None:
-        """Safely read text from a file with size limit."""
+        """Safely read text from a file with size limit.
+
+        The size is taken from the open file (fstat), not a separate stat().
+        """
         try:
-            if path.stat().st_size > max_size:
-                return None
-            return path.read_text(encoding="utf-8", errors="replace")
+            with open(path, encoding="utf-8", errors="replace") as f:
+                if os.fstat(f.fileno()).st_size > max_size:
+                    return None
+                return f.read()
         except Exception:
             return None
 
     def file_stats(self, path: Path) -> FileStats | None:
-        """Get file statistics."""
+        """Get file statistics.
+
+        One lstat() is enough unless the path is a symlink, whose target's
+        size and mtime are reported.
+        """
         try:
-            stat = path.stat()
+            stat = os.lstat(path)
+            is_symlink = S_ISLNK(stat.st_mode)
+            if is_symlink:
+                stat = os.stat(path)
             return FileStats(
                 size=stat.st_size,
                 mtime=stat.st_mtime,
-                is_symlink=path.is_symlink(),
+                is_symlink=is_symlink,
             )
         except Exception:
             return None
 
     def count_files(self, pattern: str = "**/*") -> int:
-        """Count files matching pattern."""
-        count = 0
-        for path in self.glob(pattern):
-            if path.is_file():
-                count += 1
-        return count
+        """Count files matching pattern.
+
+        Goes around the glob cache: the whole-tree listing is only counted.
+        The count of all files comes from ``build_index()``, run on first use.
+        """
+        if pattern == "**/*":
+            if self._file_count is None:
+                self.build_index()
+            return self._file_count
+        skip_symlinks = not self.follow_symlinks
+        entries = self._match_entries(pattern, skip_symlinks)
+        if entries is not None:
+            return sum(1 for entry in entries if entry.is_file())
+        return sum(1 for path in self._iter_glob(pattern, skip_symlinks) if path.is_file())
+
+
+def read_loose_tags(git_dir: str) -> list[str] | None:
+    """Tag names read straight from ``refs/tags``, without running git.
+
+    Returns None when the refs on disk are not the whole story (packed
+    tags, nested tag names, worktree ``.git`` files, reftable storage), so
+    the caller has to ask git instead.
+    """
+    if not os.path.isdir(git_dir) or os.path.isdir(os.path.join(git_dir, "reftable")):
+        return None
+    try:
+        with open(os.path.join(git_dir, "packed-refs"), "rb") as f:
+            if b"refs/tags/" in f.read():
+                return None
+    except OSError:
+        pass
+
+    try:
+        with os.scandir(os.path.join(git_dir, "refs", "tags")) as it:
+            entries = list(it)
+    except OSError:
+        return []
+    if any(entry.is_dir(follow_symlinks=False) for entry in entries):
+        return None
+    return sorted(entry.name for entry in entries)
 
 
 @dataclass
@@ -93,61 +367,191 @@ class GitInfo:
     is_repo: bool = False
     branch: str | None = None
     head_sha: str | None = None
-    tags: list[str] = field(default_factory=list)
     tracked_files: set[str] = field(default_factory=set)
-
-    @classmethod
-    def from_repo(cls, root_path: Path) -> "GitInfo":
-        """Extract git information from repository."""
-        info = cls()
-
-        # Check if it's a git repo
-        git_dir = root_path / ".git"
-        if not git_dir.exists():
-            return info
-
-        info.is_repo = True
+    root_path: Path | None = field(default=None, repr=False)
+    # Open pygit2 repository, when pygit2 is installed and could read the repo
+    _repo: Any = field(default=None, init=False, repr=False)
+
+    @cached_property
+    def tags(self) -> list[str]:
+        """Tag names, read on first access only.
+
+        Loose tags are listed from ``.git/refs/tags``; otherwise they come
+        from pygit2 when available, and only then from ``git tag --list``.
+        """
+        if not self.is_repo or self.root_path is None:
+            return []
+
+        tags = read_loose_tags(os.path.join(self.root_path, ".git"))
+        if tags is not None:
+            return tags
+
+        if self._repo is not None:
+            prefix = "refs/tags/"
+            try:
+                refs = self._repo.listall_references()
+            except pygit2.GitError:
+                pass
+            else:
+                return sorted(ref[len(prefix):] for ref in refs if ref.startswith(prefix))
 
         try:
-            # Get current branch
             result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=root_path,
+                ["git", "tag", "--list"],
+                cwd=self.root_path,
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-            if result.returncode == 0:
-                info.branch = result.stdout.strip()
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return []
+
+        if result.returncode != 0:
+            return []
+        return result.stdout.splitlines()
+
+    @cached_property
+    def listed_files(self) -> list[str] | None:
+        """Tracked and untracked, non-ignored file paths (``git ls-files -co``).
+
+        Listed on first access only; None outside a git repository or when
+        git is unavailable, so callers can fall back to walking the tree.
+        """
+        if not self.is_repo or self.root_path is None:
+            return None
 
-            # Get HEAD SHA
+        try:
             result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=root_path,
+                ["git", "ls-files", "-co", "--exclude-standard", "-z"],
+                cwd=self.root_path,
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
-            if result.returncode == 0:
-                info.head_sha = result.stdout.strip()[:12]
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+
+        if result.returncode != 0:
+            return None
+        # Paths are raw bytes; fsdecode keeps non-UTF-8 names round-trippable
+        try:
+            return [os.fsdecode(p) for p in result.stdout.split(b"\0") if p]
+        except UnicodeDecodeError:
+            return None
+
+    @classmethod
+    def from_repo(cls, root_path: Path) -> "GitInfo":
+        """Extract git information from repository."""
+        info = cls(root_path=root_path)
 
-            # Get tags
+        # Check if it's a git repo; in worktrees and submodules .git is a file
+        if not os.path.lexists(os.path.join(root_path, ".git")):
+            return info
+
+        info.is_repo = True
+
+        if pygit2 is not None:
+            try:
+                repo = pygit2.Repository(os.fspath(root_path))
+                if not repo.head_is_unborn:
+                    info.head_sha = str(repo.head.target)[:12]
+                    # Same as rev-parse --abbrev-ref: "HEAD" when detached
+                    info.branch = "HEAD" if repo.head_is_detached else repo.head.shorthand
+            except pygit2.GitError:
+                pass  # fall back to the git executable
+            else:
+                info._repo = repo
+                return info
+
+        try:
+            # HEAD SHA and current branch from one process, one per line
+            # (--abbrev-ref only applies to the arguments after it)
             result = subprocess.run(
-                ["git", "tag", "--list"],
-                cwd=root_path,
+                ["git", "-C", str(root_path), "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-            if result.returncode == 0:
-                info.tags = [t for t in result.stdout.strip().split("\n") if t]
-
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+            return info
+
+        lines = result.stdout.splitlines()
+        if result.returncode == 0 and len(lines) == 2:
+            info.head_sha = lines[0].strip()[:12]
+            info.branch = lines[1].strip()
 
         return info
 
 
+# Stack indicators: top-level files (or wildcards) whose presence implies
+# a language, package manager or CI provider
+LANGUAGE_INDICATORS: dict[str, tuple[str, ...]] = {
+    "Python": ("*.py", "pyproject.toml", "setup.py", "requirements.txt"),
+    "JavaScript": ("*.js", "*.jsx", "package.json"),
+    "TypeScript": ("*.ts", "*.tsx", "tsconfig.json"),
+    "Go": ("*.go", "go.mod"),
+    "Rust": ("*.rs", "Cargo.toml"),
+    "Java": ("*.java", "pom.xml", "build.gradle"),
+    "Ruby": ("*.rb", "Gemfile"),
+    "PHP": ("*.php", "composer.json"),
+    "C#": ("*.cs", "*.csproj"),
+}
+
+PACKAGE_MANAGER_INDICATORS: dict[str, tuple[str, ...]] = {
+    "npm": ("package-lock.json",),
+    "yarn": ("yarn.lock",),
+    "pnpm": ("pnpm-lock.yaml",),
+    "pip": ("requirements.txt",),
+    "poetry": ("poetry.lock",),
+    "uv": ("uv.lock",),
+    "pipenv": ("Pipfile.lock",),
+    "cargo": ("Cargo.lock",),
+    "go modules": ("go.sum",),
+    "maven": ("pom.xml",),
+    "gradle": ("build.gradle", "build.gradle.kts"),
+    "composer": ("composer.lock",),
+    "bundler": ("Gemfile.lock",),
+}
+
+CI_INDICATORS: dict[str, tuple[str, ...]] = {
+    "GitHub Actions": (".github/workflows/*.yml", ".github/workflows/*.yaml"),
+    "GitLab CI": (".gitlab-ci.yml",),
+    "CircleCI": (".circleci/config.yml",),
+    "Travis CI": (".travis.yml",),
+    "Azure Pipelines": ("azure-pipelines.yml",),
+    "Jenkins": ("Jenkinsfile",),
+}
+
+# An indicator's patterns split by how they are matched: exact top-level
+# names, top-level ``*.ext`` suffixes, and compiled ``dir/pattern`` probes
+IndicatorProbe = tuple[
+    str, frozenset[str], frozenset[str], tuple[tuple[str, Callable[[str], Any]], ...]
+]
+
+
+def compile_indicators(indicators: dict[str, tuple[str, ...]]) -> tuple[IndicatorProbe, ...]:
+    """Classify indicator patterns once, so detection never re-parses them."""
+    probes = []
+    for label, patterns in indicators.items():
+        names: set[str] = set()
+        suffixes: set[str] = set()
+        nested = []
+        for pattern in patterns:
+            if "/" in pattern:
+                dirname, basename = posixpath.split(pattern)
+                nested.append((dirname, re.compile(translate(basename)).match))
+            elif pattern.startswith("*.") and is_literal(pattern[1:]):
+                suffixes.add(pattern[1:])
+            else:
+                names.add(pattern)
+        probes.append((label, frozenset(names), frozenset(suffixes), tuple(nested)))
+    return tuple(probes)
+
+
+LANGUAGE_PROBES = compile_indicators(LANGUAGE_INDICATORS)
+PACKAGE_MANAGER_PROBES = compile_indicators(PACKAGE_MANAGER_INDICATORS)
+CI_PROBES = compile_indicators(CI_INDICATORS)
+
+
 @dataclass
 class StackInfo:
     """Detected technology stack information."""
@@ -158,89 +562,105 @@ class StackInfo:
 
     @classmethod
     def detect(cls, fs: FileIndex) -> "StackInfo":
-        """Detect technology stack from file system."""
-        info = cls()
-
-        # Detect languages
-        lang_indicators: dict[str, list[str]] = {
-            "Python": ["*.py", "pyproject.toml", "setup.py", "requirements.txt"],
-            "JavaScript": ["*.js", "*.jsx", "package.json"],
-            "TypeScript": ["*.ts", "*.tsx", "tsconfig.json"],
-            "Go": ["*.go", "go.mod"],
-            "Rust": ["*.rs", "Cargo.toml"],
-            "Java": ["*.java", "pom.xml", "build.gradle"],
-            "Ruby": ["*.rb", "Gemfile"],
-            "PHP": ["*.php", "composer.json"],
-            "C#": ["*.cs", "*.csproj"],
-        }
-
-        for lang, patterns in lang_indicators.items():
-            for pattern in patterns:
-                if fs.exists(pattern):
-                    if lang not in info.languages:
-                        info.languages.append(lang)
-                    break
-
-        # Detect package managers
-        pm_indicators: dict[str, list[str]] = {
-            "npm": ["package-lock.json"],
-            "yarn": ["yarn.lock"],
-            "pnpm": ["pnpm-lock.yaml"],
-            "pip": ["requirements.txt"],
-            "poetry": ["poetry.lock"],
-            "uv": ["uv.lock"],
-            "pipenv": ["Pipfile.lock"],
-            "cargo": ["Cargo.lock"],
-            "go modules": ["go.sum"],
-            "maven": ["pom.xml"],
-            "gradle": ["build.gradle", "build.gradle.kts"],
-            "composer": ["composer.lock"],
-            "bundler": ["Gemfile.lock"],
-        }
-
-        for pm, patterns in pm_indicators.items():
-            for pattern in patterns:
-                if fs.exists(pattern):
-                    if pm not in info.package_managers:
-                        info.package_managers.append(pm)
-                    break
-
-        # Detect CI providers
-        ci_indicators: dict[str, list[str]] = {
-            "GitHub Actions": [".github/workflows/*.yml", ".github/workflows/*.yaml"],
-            "GitLab CI": [".gitlab-ci.yml"],
-            "CircleCI": [".circleci/config.yml"],
-            "Travis CI": [".travis.yml"],
-            "Azure Pipelines": ["azure-pipelines.yml"],
-            "Jenkins": ["Jenkinsfile"],
-        }
-
-        for ci, patterns in ci_indicators.items():
-            for pattern in patterns:
-                if fs.exists(pattern):
-                    if ci not in info.ci_providers:
-                        info.ci_providers.append(ci)
-                    break
+        """Detect technology stack from file system.
+
+        Every indicator is matched in memory against one listing of the root
+        (plus the few CI directories), instead of probing the disk per pattern.
+        """
+        names = fs.root_names()
+        suffixes = {os.path.splitext(name)[1] for name in names}
+
+        def detected(probes: tuple[IndicatorProbe, ...]) -> list[str]:
+            return [
+                label
+                for label, literal_names, literal_suffixes, nested in probes
+                if not literal_names.isdisjoint(names)
+                or not literal_suffixes.isdisjoint(suffixes)
+                or any(any(map(match, fs.list_dir(dirname))) for dirname, match in nested)
+            ]
 
-        return info
+        return cls(
+            languages=detected(LANGUAGE_PROBES),
+            package_managers=detected(PACKAGE_MANAGER_PROBES),
+            ci_providers=detected(CI_PROBES),
+        )
 
 
 @dataclass
 class Context:
-    """Complete context for running checks."""
+    """Complete context for running checks.
+
+    A context describes one repository for the duration of one scan. Lookups
+    (file listings, git tags) are memoized on first use and never invalidated,
+    so build a fresh context for every scan.
+    """
 
     root_path: Path
     fs: FileIndex
     git: GitInfo
     stack: StackInfo
     config: Config
+    _weights: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def resolved_weight(self, info: "CheckInfo") -> int:
+        """Score impact of a check with config overrides applied, resolved once per scan."""
+        weight = self._weights.get(info.id)
+        if weight is None:
+            weight = self._weights[info.id] = self.config.checks.weights.get(
+                info.id, info.default_weight
+            )
+        return weight
+
+    def iter_files(
+        self,
+        match: Callable[[str], bool],
+        prune_dirs: frozenset[str] = frozenset(),
+    ) -> Iterator[tuple[str, Path]]:
+        """Yield ``(relative path, path)`` of repository files whose name matches.
+
+        In a git repository the files come from one ``git ls-files`` call, so
+        ignored trees are never visited; otherwise the tree is walked. Files
+        under a directory named in ``prune_dirs`` or in the configured
+        ``exclude_dirs`` are left out either way.
+        """
+        prune_dirs = prune_dirs.union(self.config.exclude_dirs)
+        listed = self.git.listed_files
+        if listed is None:
+            yield from self.fs.walk_files(match, prune_dirs)
+            return
+
+        for rel_path in listed:
+            *dirs, name = rel_path.split("/")
+            if not match(name) or not prune_dirs.isdisjoint(dirs):
+                continue
+            path = self.fs.root / rel_path
+            if not self.fs.follow_symlinks and path.is_symlink():
+                continue
+            yield rel_path, path
+
+    @cached_property
+    def readme_path(self) -> Path | None:
+        """Path of the repository README, or None if there is none."""
+        names = self.fs.root_names()
+        for name in README_NAMES:
+            if name in names:
+                return self.fs.root / name
+        return None
+
+    @cached_property
+    def readme_text(self) -> str | None:
+        """Contents of the README, read once and shared between checks."""
+        if self.readme_path is None:
+            return None
+        return self.fs.read_text_safe(self.readme_path)
 
     @classmethod
     def build(cls, path: Path, config: Config) -> "Context":
         """Build context from a repository path."""
-        root_path = path.resolve()
-
-        fs = FileIndex(root_path)
+        # Resolves the path once
+        fs = FileIndex(path, prune_dirs=PRUNE_DIRS.union(config.exclude_dirs))
+        root_path = fs.root
+        fs.build_index()
         git = GitInfo.from_repo(root_path)
         stack = StackInfo.detect(fs)
 
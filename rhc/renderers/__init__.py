@@ -1,5 +1,7 @@
 """Renderer exports."""
 
+from functools import lru_cache
+
 from rhc.renderers.json import JsonRenderer
 from rhc.renderers.md import MarkdownRenderer
 from rhc.renderers.text import TextRenderer
@@ -7,17 +9,21 @@ from rhc.renderers.text import TextRenderer
 __all__ = ["JsonRenderer", "MarkdownRenderer", "TextRenderer"]
 
 
-def get_renderer(format: str, plain: bool = False):
+@lru_cache(maxsize=8)
+def get_renderer(format: str, plain: bool = False, color: bool = False):
     """Get renderer by format name.
 
+    Renderers hold no per-report state, so instances are cached and shared.
+
     Args:
         format: Output format (text, json, md, markdown)
         plain: If True, use ASCII-only output for text format
+        color: If True, keep ANSI colors in text output
     """
     if format.lower() in ("text",):
-        return TextRenderer(plain=plain)
+        return TextRenderer(plain=plain, color=color)
     elif format.lower() in ("json",):
         return JsonRenderer()
     elif format.lower() in ("md", "markdown"):
         return MarkdownRenderer()
-    return TextRenderer(plain=plain)
+    return TextRenderer(plain=plain, color=color)
@@ -2,7 +2,10 @@
 
 from abc import ABC, abstractmethod
 
-from rhc.types import Report
+from rhc.types import Report, Severity
+
+# Severities from most to least severe, the order reports list them in
+SEVERITY_ORDER = (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO)
 
 
 class BaseRenderer(ABC):
@@ -1,9 +1,41 @@
 """JSON renderer."""
 
 import json
+from dataclasses import fields
+from typing import Any
+
+try:  # optional faster encoder, see the "fast" extra
+    import orjson
+except ImportError:
+    orjson = None
 
 from rhc.renderers.base import BaseRenderer
-from rhc.types import Report
+from rhc.types import Evidence, Finding, Metrics, RepoInfo, Report, ReportMeta, Summary
+
+# Field names of the report dataclasses, in output order, looked up once
+FIELDS_BY_TYPE = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (Report, ReportMeta, Summary, Finding, Evidence, Metrics)
+}
+
+
+def _default(obj: Any) -> Any:
+    """Encode report dataclasses for ``json.dumps`` as they are reached.
+
+    Same document as ``Report.to_dict()``, without building that tree first.
+    """
+    if isinstance(obj, RepoInfo):
+        return obj.to_dict()
+    names = FIELDS_BY_TYPE.get(type(obj))
+    if names is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return {name: getattr(obj, name) for name in names}
+
+
+# Built once: json.dumps() with any non-default argument creates a new encoder per call
+ENCODER = json.JSONEncoder(default=_default, indent=2, ensure_ascii=False)
+# orjson options for the report document
+ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
 
 
 class JsonRenderer(BaseRenderer):
@@ -11,4 +43,15 @@ class JsonRenderer(BaseRenderer):
 
     def render(self, report: Report) -> str:
         """Render report as JSON."""
-        return json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson encodes the dataclasses and enums natively, in field order,
+            # which matches to_dict(); only the repo section has its own shape
+            document = {
+                "meta": report.meta,
+                "repo": report.repo.to_dict(),
+                "summary": report.summary,
+                "findings": report.findings,
+                "metrics": report.metrics,
+            }
+            return orjson.dumps(document, option=ORJSON_OPTIONS).decode()
+        return ENCODER.encode(report)
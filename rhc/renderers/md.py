@@ -1,6 +1,6 @@
 """Markdown renderer for PR/Issue reports."""
 
-from rhc.renderers.base import BaseRenderer
+from rhc.renderers.base import SEVERITY_ORDER, BaseRenderer
 from rhc.types import Report, Severity
 
 # Severity to emoji for markdown
@@ -36,7 +36,7 @@ class MarkdownRenderer(BaseRenderer):
 
         counts = report.summary.counts_by_severity
         summary_parts = []
-        for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]:
+        for severity in SEVERITY_ORDER:
             count = counts.get(severity.value, 0)
             if count > 0:
                 summary_parts.append(f"{SEVERITY_BADGES[severity]}: {count}")
@@ -1,13 +1,15 @@
 """Text (terminal) renderer with rich formatting."""
 
+import io
 import sys
+from functools import cache
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
-from rich.text import Text
 
-from rhc.renderers.base import BaseRenderer
+from rhc.renderers.base import SEVERITY_ORDER, BaseRenderer
 from rhc.types import Report, Severity
 
 # Severity to color mapping
@@ -47,6 +49,7 @@ GRADE_COLORS = {
 }
 
 
+@cache
 def _detect_unicode_support() -> bool:
     """Detect if terminal supports unicode."""
     encoding = getattr(sys.stdout, "encoding", None)
@@ -58,21 +61,29 @@ def _detect_unicode_support() -> bool:
 class TextRenderer(BaseRenderer):
     """Terminal-friendly text renderer using Rich."""
 
-    def __init__(self, plain: bool = False):
+    def __init__(self, plain: bool = False, color: bool = False):
         """Initialize renderer.
 
         Args:
             plain: If True, use ASCII-only output without colors/unicode.
+            color: If True, keep ANSI color codes in the rendered string.
         """
         self.plain = plain
+        self.color = color and not plain
         self.use_unicode = not plain and _detect_unicode_support()
+        self._severity_icons = SEVERITY_ICONS_UNICODE if self.use_unicode else SEVERITY_ICONS_ASCII
 
     def render(self, report: Report) -> str:
         """Render report to terminal-formatted string."""
         if self.plain:
             return self._render_plain(report)
 
-        console = Console(record=True, force_terminal=True, width=100)
+        # Rendered into memory only; the caller decides where the string goes.
+        # Lines are markup strings, so automatic highlighting is switched off
+        # to keep numbers and brackets in the style the markup gives them.
+        console = Console(
+            file=io.StringIO(), record=True, force_terminal=True, width=100, highlight=False
+        )
 
         # Header with score
         self._render_header(console, report)
@@ -90,13 +101,11 @@ class TextRenderer(BaseRenderer):
         # Footer
         self._render_footer(console, report)
 
-        return console.export_text()
+        return console.export_text(styles=self.color)
 
     def _get_severity_icon(self, severity: Severity) -> str:
         """Get severity icon based on unicode support."""
-        if self.use_unicode:
-            return SEVERITY_ICONS_UNICODE.get(severity, "")
-        return SEVERITY_ICONS_ASCII.get(severity, "")
+        return self._severity_icons.get(severity, "")
 
     def _render_header(self, console: Console, report: Report) -> None:
         """Render the header with score and grade."""
@@ -105,10 +114,7 @@ class TextRenderer(BaseRenderer):
         grade_color = GRADE_COLORS.get(grade, "white")
 
         # Grade display
-        grade_text = Text()
-        grade_text.append("Repo Health Score: ", style="bold")
-        grade_text.append(f"{score}/100 ", style=grade_color)
-        grade_text.append(f"(Grade: {grade})", style=grade_color)
+        grade_text = f"[bold]Repo Health Score: [/bold][{grade_color}]{score}/100 (Grade: {grade})[/]"
 
         console.print()
         console.print(Panel(grade_text, title="[bold]RHC Report[/bold]", border_style=grade_color))
@@ -121,20 +127,18 @@ class TextRenderer(BaseRenderer):
         if not has_findings:
             console.print()
             icon = "✓" if self.use_unicode else "[OK]"
-            console.print(f"[green]{icon} No issues found![/green]")
+            console.print(f"[green]{escape(icon)} No issues found![/]")
             return
 
-        summary_text = Text("Issues: ")
         parts = []
-        for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]:
+        for severity in SEVERITY_ORDER:
             count = counts.get(severity.value, 0)
             if count > 0:
                 icon = self._get_severity_icon(severity)
                 parts.append(f"{icon} {count} {severity.value}")
 
-        summary_text.append("  ".join(parts))
         console.print()
-        console.print(summary_text)
+        console.print(f"Issues: {escape('  '.join(parts))}")
 
     def _render_findings(self, console: Console, report: Report) -> None:
         """Render findings table."""
@@ -149,11 +153,12 @@ class TextRenderer(BaseRenderer):
         # Show top findings (max 10)
         for finding in report.findings[:10]:
             icon = self._get_severity_icon(finding.severity)
-            color = SEVERITY_COLORS.get(finding.severity, "")
+            color = SEVERITY_COLORS.get(finding.severity)
+            title = escape(finding.title)
             table.add_row(
                 icon,
                 finding.id,
-                Text(finding.title, style=color),
+                f"[{color}]{title}[/]" if color else title,
                 str(finding.score_impact),
             )
 
@@ -184,7 +189,7 @@ class TextRenderer(BaseRenderer):
             parts.append(f"{icon} {ci}")
 
         if parts:
-            console.print("  ".join(parts), style="dim")
+            console.print(f"[dim]{escape('  '.join(parts))}[/]")
 
     def _render_footer(self, console: Console, report: Report) -> None:
         """Render footer with timing info."""
@@ -195,9 +200,8 @@ class TextRenderer(BaseRenderer):
             if report.repo.head_sha:
                 git_info += f"@{report.repo.head_sha}"
 
-        console.print(
-            f"[dim]rhc v{report.meta.tool_version} | {report.meta.duration_ms}ms{git_info}[/dim]"
-        )
+        footer = f"rhc v{report.meta.tool_version} | {report.meta.duration_ms}ms{git_info}"
+        console.print(f"[dim]{escape(footer)}[/]")
         console.print()
 
     def _render_plain(self, report: Report) -> str:
@@ -221,7 +225,7 @@ class TextRenderer(BaseRenderer):
             lines.append("[OK] No issues found!")
         else:
             parts = []
-            for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]:
+            for severity in SEVERITY_ORDER:
                 count = counts.get(severity.value, 0)
                 if count > 0:
                     parts.append(f"{count} {severity.value}")
@@ -5,11 +5,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from rhc import __version__
-from rhc.checks import filter_checks, get_all_checks
+from rhc.checks import filter_checks, get_checks, run_all
 from rhc.config import Config
 from rhc.context import Context
 from rhc.scoring import create_summary
-from rhc.types import Finding, Metrics, RepoInfo, Report, ReportMeta
+from rhc.types import Metrics, RepoInfo, Report, ReportMeta
 
 
 def scan(path: Path, config: Config) -> Report:
@@ -28,26 +28,14 @@ def scan(path: Path, config: Config) -> Report:
     ctx = Context.build(path, config)
 
     # Get and filter checks
-    all_checks = get_all_checks()
-    checks = filter_checks(
-        all_checks,
-        skip=config.checks.skip,
-        only=config.checks.only if config.checks.only else None,
-    )
+    only = config.checks.only or None
+    checks = filter_checks(get_checks(only), skip=config.checks.skip, only=only)
 
     # Run all checks
-    findings: list[Finding] = []
-    for check in checks:
-        try:
-            check_findings = check.run(ctx)
-            findings.extend(check_findings)
-        except Exception as e:
-            if config.debug:
-                print(f"[DEBUG] Check {check.id} failed: {e}")
-            # Continue with other checks
+    findings = run_all(ctx, checks)
 
     # Sort findings by severity (highest first) then by impact
-    findings.sort(key=lambda f: (-list(f.severity.__class__).index(f.severity), f.score_impact))
+    findings.sort(key=lambda f: (-f.severity.rank, f.score_impact))
 
     # Calculate timing
     duration_ms = int((time.time() - start_time) * 1000)
@@ -60,7 +48,7 @@ def scan(path: Path, config: Config) -> Report:
             duration_ms=duration_ms,
         ),
         repo=RepoInfo(
-            path=str(path.resolve()),
+            path=ctx.fs.root_str,
             is_git_repo=ctx.git.is_repo,
             branch=ctx.git.branch,
             head_sha=ctx.git.head_sha,
@@ -1,7 +1,13 @@
 """Scoring and grading logic."""
 
+from bisect import bisect_right
+
 from rhc.types import Finding, Severity, Summary
 
+# Lower score bound of each grade, ascending, and the grade it starts
+GRADE_BOUNDS = (0, 55, 70, 80, 90)
+GRADE_LABELS = ("F", "D", "C", "B", "A")
+
 
 def calculate_score(findings: list[Finding]) -> int:
     """Calculate the health score from findings.
@@ -26,16 +32,7 @@ def calculate_grade(score: int) -> str:
     D: 55-69
     F: 0-54
     """
-    if score >= 90:
-        return "A"
-    elif score >= 80:
-        return "B"
-    elif score >= 70:
-        return "C"
-    elif score >= 55:
-        return "D"
-    else:
-        return "F"
+    return GRADE_LABELS[max(0, bisect_right(GRADE_BOUNDS, score) - 1)]
 
 
 def count_by_severity(findings: list[Finding]) -> dict[str, int]:
@@ -56,13 +53,26 @@ def count_by_category(findings: list[Finding]) -> dict[str, int]:
 
 
 def create_summary(findings: list[Finding]) -> Summary:
-    """Create a summary from findings."""
-    score = calculate_score(findings)
+    """Create a summary from findings.
+
+    Score and both count tables are accumulated in a single pass; the result
+    matches ``calculate_score``, ``count_by_severity`` and ``count_by_category``.
+    """
+    score = 100
+    severity_counts: dict[str, int] = {s.value: 0 for s in Severity}
+    category_counts: dict[str, int] = {}
+    for finding in findings:
+        score += finding.score_impact
+        severity_counts[finding.severity.value] += 1
+        cat = finding.category.value
+        category_counts[cat] = category_counts.get(cat, 0) + 1
+
+    score = max(0, min(100, score))
     return Summary(
         total_score=score,
         grade=calculate_grade(score),
-        counts_by_severity=count_by_severity(findings),
-        counts_by_category=count_by_category(findings),
+        counts_by_severity=severity_counts,
+        counts_by_category=category_counts,
     )
 
 
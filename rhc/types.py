@@ -6,17 +6,39 @@ from typing import Any
 
 
 class Severity(str, Enum):
-    """Severity levels for findings."""
+    """Severity levels for findings.
 
-    INFO = "info"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+    Values stay strings (config, JSON and Markdown use them); comparisons use
+    the integer ``rank`` carried by each member, INFO lowest.
+    """
 
+    rank: int
+
+    def __new__(cls, value: str, rank: int) -> "Severity":
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.rank = rank
+        return member
+
+    INFO = ("info", 0)
+    LOW = ("low", 1)
+    MEDIUM = ("medium", 2)
+    HIGH = ("high", 3)
+    CRITICAL = ("critical", 4)
+
+    # All four are defined: the inherited str methods would compare the values
+    # alphabetically, and functools.total_ordering does not replace them
     def __lt__(self, other: "Severity") -> bool:
-        order = [Severity.INFO, Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL]
-        return order.index(self) < order.index(other)
+        return self.rank < other.rank
+
+    def __le__(self, other: "Severity") -> bool:
+        return self.rank <= other.rank
+
+    def __gt__(self, other: "Severity") -> bool:
+        return self.rank > other.rank
+
+    def __ge__(self, other: "Severity") -> bool:
+        return self.rank >= other.rank
 
 
 class Category(str, Enum):
@@ -42,7 +64,7 @@ CATEGORY_WEIGHTS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence supporting a finding."""
 
@@ -50,8 +72,11 @@ class Evidence:
     files: list[str] = field(default_factory=list)
     details: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"description": self.description, "files": self.files, "details": self.details}
+
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single finding from a check."""
 
@@ -72,16 +97,13 @@ class Finding:
             "severity": self.severity.value,
             "category": self.category.value,
             "score_impact": self.score_impact,
-            "evidence": [
-                {"description": e.description, "files": e.files, "details": e.details}
-                for e in self.evidence
-            ],
+            "evidence": list(map(Evidence.to_dict, self.evidence)),
             "recommendation": self.recommendation,
             "refs": self.refs,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportMeta:
     """Metadata about the report generation."""
 
@@ -97,7 +119,7 @@ class ReportMeta:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoInfo:
     """Information about the scanned repository."""
 
@@ -107,19 +129,14 @@ class RepoInfo:
     head_sha: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"path": self.path}
         if self.is_git_repo:
-            result["git"] = {
-                "is_repo": True,
-                "branch": self.branch,
-                "head_sha": self.head_sha,
-            }
+            git = {"is_repo": True, "branch": self.branch, "head_sha": self.head_sha}
         else:
-            result["git"] = {"is_repo": False}
-        return result
+            git = {"is_repo": False}
+        return {"path": self.path, "git": git}
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     """Summary of the scan results."""
 
@@ -137,7 +154,7 @@ class Summary:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """Additional metrics about the repository."""
 
@@ -155,7 +172,7 @@ class Metrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     """Complete health check report."""
 
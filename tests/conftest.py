@@ -1,10 +1,20 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
 
+The sample repos are written once per session into templates and copied
+into a fresh directory for every test, so tests may change them freely.
+Tests that only run checks can share the session's ``*_ctx`` contexts, built
+from the untouched templates.
+"""
+
+import shutil
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from rhc.config import Config
+from rhc.context import Context
+
 
 @pytest.fixture
 def temp_repo():
@@ -13,8 +23,7 @@ def temp_repo():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def minimal_repo(temp_repo: Path):
+def _write_minimal_repo(temp_repo: Path) -> None:
     """Create a minimal valid repo structure."""
     # README
     (temp_repo / "README.md").write_text("# Test Project\n\nA test project.")
@@ -41,19 +50,14 @@ name = "test-project"
 version = "0.1.0"
 """)
 
-    return temp_repo
-
 
-@pytest.fixture
-def bad_repo(temp_repo: Path):
+def _write_bad_repo(temp_repo: Path) -> None:
     """Create a repo with many issues."""
     # Only a single Python file, nothing else
     (temp_repo / "main.py").write_text("print('hello')\n")
-    return temp_repo
 
 
-@pytest.fixture
-def good_repo(temp_repo: Path):
+def _write_good_repo(temp_repo: Path) -> None:
     """Create a repo with best practices."""
     # README
     (temp_repo / "README.md").write_text("""# Great Project
@@ -116,4 +120,65 @@ line-length = 100
     # Lockfile
     (temp_repo / "poetry.lock").write_text("# lockfile content\n")
 
-    return temp_repo
+
+def _clone_template(template: Path, dest: Path) -> Path:
+    """Copy a template tree under dest."""
+    # Not hardlinked: a shared inode would let in-place writes, os.utime
+    # included, reach the template and every later test
+    shutil.copytree(template, dest, dirs_exist_ok=True)
+    return dest
+
+
+REPO_WRITERS = {"minimal": _write_minimal_repo, "bad": _write_bad_repo, "good": _write_good_repo}
+
+
+@pytest.fixture(scope="session")
+def repo_templates(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write every sample repo once per session."""
+    templates = {}
+    for name, write in REPO_WRITERS.items():
+        templates[name] = tmp_path_factory.mktemp(f"{name}_repo")
+        write(templates[name])
+    return templates
+
+
+@pytest.fixture
+def minimal_repo(temp_repo: Path, repo_templates: dict[str, Path]):
+    """A minimal valid repo structure."""
+    return _clone_template(repo_templates["minimal"], temp_repo)
+
+
+@pytest.fixture
+def bad_repo(temp_repo: Path, repo_templates: dict[str, Path]):
+    """A repo with many issues."""
+    return _clone_template(repo_templates["bad"], temp_repo)
+
+
+@pytest.fixture
+def good_repo(temp_repo: Path, repo_templates: dict[str, Path]):
+    """A repo with best practices."""
+    return _clone_template(repo_templates["good"], temp_repo)
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """Default configuration, shared by tests that never modify it."""
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def minimal_ctx(repo_templates: dict[str, Path], default_config: Config) -> Context:
+    """Shared, read-only context of the minimal repo."""
+    return Context.build(repo_templates["minimal"], default_config)
+
+
+@pytest.fixture(scope="session")
+def bad_ctx(repo_templates: dict[str, Path], default_config: Config) -> Context:
+    """Shared, read-only context of the bad repo."""
+    return Context.build(repo_templates["bad"], default_config)
+
+
+@pytest.fixture(scope="session")
+def good_ctx(repo_templates: dict[str, Path], default_config: Config) -> Context:
+    """Shared, read-only context of the good repo."""
+    return Context.build(repo_templates["good"], default_config)
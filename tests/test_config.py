@@ -0,0 +1,79 @@
+"""Tests for configuration loading."""
+
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
+
+import pytest
+
+from rhc.config import Config
+from rhc.types import Severity
+
+
+def test_load_from_file(temp_repo: Path):
+    """Test policy and check settings are read from .rhc.yml."""
+    (temp_repo / ".rhc.yml").write_text("""version: 1
+exclude_dirs: [third_party]
+policy:
+  min_score: 80
+  fail_on: high
+checks:
+  skip: [SEC.SECRETS_SUSPECTED]
+  weights:
+    DOC.README_PRESENT: -8
+  parallel: false
+""")
+
+    config = Config.load(repo_path=temp_repo)
+
+    assert config.policy.min_score == 80
+    assert config.policy.fail_on == Severity.HIGH
+    assert config.checks.skip == ("SEC.SECRETS_SUSPECTED",)
+    assert config.checks.weights == {"DOC.README_PRESENT": -8}
+    assert config.checks.parallel is False
+    assert config.exclude_dirs == ("third_party",)
+
+
+def test_load_reparses_changed_file(temp_repo: Path):
+    """Test cached parses are not reused after the file changes, nor shared."""
+    path = temp_repo / ".rhc.yml"
+    path.write_text("checks:\n  skip: [DOC.LICENSE_PRESENT]\n  weights: {DOC.README_PRESENT: -8}\n")
+
+    first = Config.load(config_path=path)
+    first.checks.weights["DOC.README_PRESENT"] = -1
+    second = Config.load(config_path=path)
+    assert second.checks.skip == ("DOC.LICENSE_PRESENT",)
+    assert second.checks.weights == {"DOC.README_PRESENT": -8}
+
+    path.write_text("checks:\n  skip: [HYG.GITIGNORE_PRESENT, DOC.LICENSE_PRESENT]\n")
+    assert Config.load(config_path=path).checks.skip == ("HYG.GITIGNORE_PRESENT", "DOC.LICENSE_PRESENT")
+
+
+def test_unknown_fail_on_is_ignored(temp_repo: Path):
+    """Test invalid severities in the file or CLI leave fail_on unset."""
+    (temp_repo / ".rhc.yml").write_text("policy:\n  fail_on: catastrophic\n")
+
+    config = Config.load(repo_path=temp_repo)
+    assert config.policy.fail_on is None
+
+    assert config.merge_cli_args(fail_on="bogus").policy.fail_on is None
+    assert config.merge_cli_args(fail_on="medium").policy.fail_on == Severity.MEDIUM
+    assert config.policy.fail_on is None
+
+
+def test_scalar_exclude_dirs_is_ignored(temp_repo: Path):
+    """Test a single string is not split into one directory per character."""
+    (temp_repo / ".rhc.yml").write_text("exclude_dirs: build\n")
+
+    assert Config.load(repo_path=temp_repo).exclude_dirs == ()
+
+
+def test_config_is_frozen_and_hashable():
+    """Test configs cannot be changed in place and can key caches."""
+    config = Config()
+    merged = config.merge_cli_args(skip=["DOC.LICENSE_PRESENT", "DOC.LICENSE_PRESENT"], debug=True)
+
+    with pytest.raises(FrozenInstanceError):
+        config.debug = True  # type: ignore[misc]
+    assert merged.checks.skip == ("DOC.LICENSE_PRESENT",)
+    assert merged.debug and not config.debug
+    assert hash(merged) == hash(replace(config, checks=merged.checks, debug=True))
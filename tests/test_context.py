@@ -0,0 +1,336 @@
+"""Tests for the repository context and file index."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from rhc.config import ChecksConfig, Config
+from rhc.context import Context, FileIndex, GitInfo, StackInfo
+
+
+def test_root_names_lists_top_level_entries(minimal_repo: Path):
+    """Test root listing contains top-level files and directories only."""
+    fs = FileIndex(minimal_repo)
+    names = fs.root_names()
+
+    assert "README.md" in names
+    assert "tests" in names
+    assert "main.py" not in names  # lives in src/
+
+
+def test_root_names_is_memoized(minimal_repo: Path):
+    """Test root listing is computed once per index."""
+    fs = FileIndex(minimal_repo)
+    first = fs.root_names()
+    (minimal_repo / "NEW_FILE").write_text("")
+
+    assert fs.root_names() is first
+    assert "NEW_FILE" not in fs.root_names()
+
+
+def test_git_tags_empty_outside_repo(minimal_repo: Path):
+    """Test tags resolve to an empty list without spawning git for non-repos."""
+    git = GitInfo.from_repo(minimal_repo)
+
+    assert not git.is_repo
+    assert git.tags == []
+
+
+def test_git_tags_loose_and_packed(temp_repo: Path):
+    """Test loose tags are read from disk and packed tags still come from git."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=temp_repo, check=True)
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "init"], cwd=temp_repo, check=True)
+    assert GitInfo.from_repo(temp_repo).tags == []
+
+    for tag in ("v1.1.0", "v1.0.0"):
+        subprocess.run([*git, "tag", tag], cwd=temp_repo, check=True)
+    assert GitInfo.from_repo(temp_repo).tags == ["v1.0.0", "v1.1.0"]
+
+    subprocess.run([*git, "pack-refs", "--all"], cwd=temp_repo, check=True)
+    subprocess.run([*git, "tag", "release/2.0"], cwd=temp_repo, check=True)
+    assert GitInfo.from_repo(temp_repo).tags == ["release/2.0", "v1.0.0", "v1.1.0"]
+
+
+class FakeRepository:
+    """Just enough of pygit2.Repository for GitInfo."""
+
+    # Per-test HEAD state, set before GitInfo.from_repo runs
+    head_is_unborn = False
+    head_is_detached = False
+    head = SimpleNamespace(target="0123456789abcdef0123", shorthand="main")
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def listall_references(self) -> list[str]:
+        return ["refs/heads/main", "refs/tags/v1.0.0", "refs/tags/release/2.0"]
+
+
+def test_git_info_from_pygit2(temp_repo: Path, monkeypatch):
+    """Test HEAD and tags are read through pygit2 when it is installed."""
+    fake = SimpleNamespace(Repository=FakeRepository, GitError=type("GitError", (Exception,), {}))
+    monkeypatch.setattr("rhc.context.pygit2", fake)
+    # A worktree-style .git file, so tags cannot be read from disk
+    (temp_repo / ".git").write_text("gitdir: elsewhere\n")
+
+    git = GitInfo.from_repo(temp_repo)
+    assert (git.head_sha, git.branch) == ("0123456789ab", "main")
+    assert git.tags == ["release/2.0", "v1.0.0"]
+
+    monkeypatch.setattr(FakeRepository, "head_is_detached", True)
+    git = GitInfo.from_repo(temp_repo)
+    assert (git.head_sha, git.branch) == ("0123456789ab", "HEAD")
+
+    monkeypatch.setattr(FakeRepository, "head_is_unborn", True)
+    git = GitInfo.from_repo(temp_repo)
+    assert git.is_repo
+    assert git.head_sha is None and git.branch is None
+
+
+def test_first_match(minimal_repo: Path):
+    """Test first_match for literal and wildcard patterns."""
+    fs = FileIndex(minimal_repo)
+
+    assert fs.first_match("README.md") == fs.root / "README.md"
+    assert fs.first_match("MISSING.md") is None
+    assert fs.first_match("src/*.py") is not None
+    assert fs.first_match("*.rs") is None
+
+
+def test_snapshot_prefixes_nested_entries(good_repo: Path):
+    """Test snapshot merges listings of several directories into relative paths."""
+    fs = FileIndex(good_repo)
+    snapshot = fs.snapshot({"", ".github", ".github/workflows"})
+
+    assert "README.md" in snapshot
+    assert ".github/CODEOWNERS" in snapshot
+    assert ".github/workflows/ci.yml" in snapshot
+    assert "ci.yml" not in snapshot
+
+
+def test_context_readme_accessors(minimal_repo: Path):
+    """Test README path and text are resolved once and cached on the context."""
+    ctx = Context.build(minimal_repo, Config())
+
+    assert ctx.readme_path == ctx.fs.root / "README.md"
+    assert ctx.readme_text is not None
+    assert ctx.readme_text.startswith("# Test Project")
+    assert ctx.readme_text is ctx.readme_text
+
+
+def test_context_readme_missing(bad_repo: Path):
+    """Test README accessors return None when there is no README."""
+    ctx = Context.build(bad_repo, Config())
+
+    assert ctx.readme_path is None
+    assert ctx.readme_text is None
+
+
+def test_context_resolved_weight_applies_overrides(minimal_repo: Path):
+    """Test weights honor config overrides and are resolved once per context."""
+    from rhc.checks import CHECKS_BY_ID
+
+    config = Config(checks=ChecksConfig(weights={"DOC.README_PRESENT": 3}))
+    ctx = Context.build(minimal_repo, config)
+    readme = CHECKS_BY_ID["DOC.README_PRESENT"].info
+    license_ = CHECKS_BY_ID["DOC.LICENSE_PRESENT"].info
+
+    assert ctx.resolved_weight(readme) == 3
+    assert ctx.resolved_weight(license_) == license_.default_weight
+
+    config.checks.weights["DOC.README_PRESENT"] = 7
+    assert ctx.resolved_weight(readme) == 3
+
+
+def test_glob_literal_pattern(minimal_repo: Path):
+    """Test literal patterns yield the single path only when it exists."""
+    fs = FileIndex(minimal_repo)
+
+    assert list(fs.glob("README.md")) == [fs.root / "README.md"]
+    assert list(fs.glob("nope.txt")) == []
+    assert fs.exists("README.md")
+    assert not fs.exists("nope.txt")
+
+
+def test_walk_files_filters_and_prunes(minimal_repo: Path):
+    """Test the tree walk yields matching files by relative path and prunes dirs."""
+    (minimal_repo / "node_modules").mkdir()
+    (minimal_repo / "node_modules" / "dep.py").write_text("")
+    fs = FileIndex(minimal_repo)
+
+    found = dict(fs.walk_files(lambda name: name.endswith(".py"), frozenset({"node_modules"})))
+
+    assert "src/main.py" in found
+    assert "tests/test_main.py" in found
+    assert found["src/main.py"] == fs.root / "src" / "main.py"
+    assert not any(rel.startswith("node_modules/") for rel in found)
+
+
+def test_glob_results_cached(minimal_repo: Path):
+    """Test wildcard globs walk the tree once per pattern."""
+    fs = FileIndex(minimal_repo)
+    first = list(fs.glob("**/*.py"))
+    (minimal_repo / "src" / "late.py").write_text("")
+
+    assert list(fs.glob("**/*.py")) == first
+    assert fs.root / "src" / "main.py" in first
+
+
+def test_iter_files_uses_git_listing(temp_repo: Path):
+    """Test git-ignored files are skipped when the repo is a git checkout."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    subprocess.run(["git", "init", "-q"], cwd=temp_repo, check=True)
+    (temp_repo / ".gitignore").write_text("build/\n")
+    (temp_repo / "app.py").write_text("")
+    (temp_repo / "build").mkdir()
+    (temp_repo / "build" / "out.py").write_text("")
+
+    ctx = Context.build(temp_repo, Config())
+    found = [rel for rel, _ in ctx.iter_files(lambda name: name.endswith(".py"))]
+
+    assert ctx.git.listed_files is not None
+    assert found == ["app.py"]
+
+
+def test_git_listing_keeps_non_utf8_names(temp_repo: Path):
+    """Test a non-UTF-8 file name in a git checkout does not lose the listing."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    from rhc.checks.security import SecretsSuspectedCheck
+
+    subprocess.run(["git", "init", "-q"], cwd=temp_repo, check=True)
+    try:
+        with open(os.path.join(os.fsencode(temp_repo), b"caf\xe9.py"), "w") as f:
+            f.write("")
+    except OSError:
+        pytest.skip("file system rejects non-UTF-8 names")
+    (temp_repo / "a.py").write_text("AWS_KEY = '" + "AKIA" + "ABCDEFGHIJKLMNOP" + "'\n")
+
+    ctx = Context.build(temp_repo, Config())
+    found = {rel for rel, _ in ctx.iter_files(lambda name: name.endswith(".py"))}
+
+    assert found == {"a.py", os.fsdecode(b"caf\xe9.py")}
+    findings = SecretsSuspectedCheck().run(ctx)
+    assert findings and findings[0].evidence[0].files == ["a.py"]
+
+
+def test_iter_files_walks_outside_git(minimal_repo: Path):
+    """Test the tree is walked when there is no git repository."""
+    ctx = Context.build(minimal_repo, Config())
+    found = {rel for rel, _ in ctx.iter_files(lambda name: name.endswith(".py"))}
+
+    assert ctx.git.listed_files is None
+    assert "src/main.py" in found
+
+
+def test_git_info_branch_and_sha(temp_repo: Path):
+    """Test branch and short HEAD SHA are read from a git checkout."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q", "-b", "main"], cwd=temp_repo, check=True)
+    (temp_repo / "README.md").write_text("# x\n")
+    subprocess.run([*git, "add", "README.md"], cwd=temp_repo, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], cwd=temp_repo, check=True)
+
+    info = GitInfo.from_repo(temp_repo)
+
+    assert info.is_repo
+    assert info.branch == "main"
+    assert info.head_sha is not None and len(info.head_sha) == 12
+
+
+def test_exists_top_level_from_root_listing(minimal_repo: Path):
+    """Test top-level probes are answered from the memoized root listing."""
+    fs = FileIndex(minimal_repo)
+    assert fs.exists("pyproject.toml")
+    (minimal_repo / "late.toml").write_text("")
+
+    assert fs.exists("*.toml")
+    assert not fs.exists("late.toml")
+    assert not fs.exists("*.rs")
+    assert fs.exists("src/main.py")
+
+
+def test_stack_detect(good_repo: Path):
+    """Test languages, package managers and CI providers are detected."""
+    (good_repo / "index.ts").write_text("")
+    stack = StackInfo.detect(FileIndex(good_repo))
+
+    assert stack.languages == ["Python", "TypeScript"]
+    assert stack.package_managers == ["poetry"]
+    assert stack.ci_providers == ["GitHub Actions"]
+
+
+def test_read_text_safe_and_file_stats(minimal_repo: Path):
+    """Test size-capped reads and stats of regular files and symlinks."""
+    fs = FileIndex(minimal_repo)
+    readme = minimal_repo / "README.md"
+    link = minimal_repo / "README.link"
+    link.symlink_to(readme)
+
+    assert fs.read_text_safe(readme) == readme.read_text()
+    assert fs.read_text_safe(readme, max_size=4) is None
+    assert fs.read_text_safe(minimal_repo / "missing.md") is None
+
+    stats = fs.file_stats(link)
+    assert stats is not None
+    assert stats.is_symlink
+    assert stats.size == readme.stat().st_size
+    assert fs.file_stats(readme).is_symlink is False
+
+
+def test_build_index_counts_files_and_lists_shallow_dirs(good_repo: Path):
+    """Test one walk answers count_files and pre-lists shallow directories."""
+    fs = FileIndex(good_repo)
+    fs.build_index()
+    (good_repo / ".github" / "workflows" / "late.yml").write_text("")
+
+    assert fs.count_files() == sum(1 for p in good_repo.rglob("*") if p.is_file()) - 1
+    assert "ci.yml" in fs.list_dir(".github/workflows")
+    assert "late.yml" not in fs.list_dir(".github/workflows")
+
+
+def test_exists_in_literal_directory(good_repo: Path):
+    """Test probes into a literal directory use that directory's listing."""
+    fs = FileIndex(good_repo)
+
+    assert fs.exists(".github/workflows/*.yml")
+    assert not fs.exists(".github/workflows/*.yaml")
+    assert fs.exists(".github/dependabot.yml")
+    assert not fs.exists(".circleci/config.yml")
+
+
+def test_glob_and_count_skip_symlinks(minimal_repo: Path):
+    """Test symlinks are skipped by glob and count_files unless followed."""
+    (minimal_repo / "src" / "link.py").symlink_to(minimal_repo / "src" / "main.py")
+    (minimal_repo / "dangling.md").symlink_to(minimal_repo / "missing.md")
+    fs = FileIndex(minimal_repo)
+    followed = FileIndex(minimal_repo, follow_symlinks=True)
+
+    assert fs.count_files("src/*.py") == followed.count_files("src/*.py") - 1
+    assert list(fs.glob("src/link.py")) == []
+    assert list(followed.glob("src/link.py")) == [followed.root / "src" / "link.py"]
+    assert list(followed.glob("dangling.md")) == []
+
+
+def test_index_prunes_dependency_and_configured_dirs(minimal_repo: Path):
+    """Test pruned directories are listed but their contents are not indexed."""
+    for subdir in ("node_modules/pkg", "third_party"):
+        (minimal_repo / subdir).mkdir(parents=True)
+        (minimal_repo / subdir / "index.py").write_text("")
+    baseline = FileIndex(minimal_repo, prune_dirs=frozenset()).count_files()
+
+    ctx = Context.build(minimal_repo, Config(exclude_dirs=("third_party",)))
+
+    assert ctx.fs.count_files() == baseline - 2
+    assert "node_modules" in ctx.fs.root_names()
+    assert not ctx.fs.exists("**/index.py")
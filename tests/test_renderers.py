@@ -3,9 +3,30 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from rhc.config import Config
 from rhc.renderers import JsonRenderer, MarkdownRenderer, TextRenderer, get_renderer
 from rhc.scanner import scan
+from rhc.types import Report
+
+
+@pytest.fixture(scope="module")
+def minimal_report(repo_templates: dict[str, Path], default_config: Config) -> Report:
+    """Report of the minimal sample repo, scanned once for this module."""
+    return scan(repo_templates["minimal"], default_config)
+
+
+@pytest.fixture(scope="module")
+def bad_report(repo_templates: dict[str, Path], default_config: Config) -> Report:
+    """Report of the bad sample repo, scanned once for this module."""
+    return scan(repo_templates["bad"], default_config)
+
+
+@pytest.fixture(scope="module")
+def good_report(repo_templates: dict[str, Path], default_config: Config) -> Report:
+    """Report of the good sample repo, scanned once for this module."""
+    return scan(repo_templates["good"], default_config)
 
 
 def test_get_renderer():
@@ -16,58 +37,49 @@ def test_get_renderer():
     assert isinstance(get_renderer("markdown"), MarkdownRenderer)
     # Default to text
     assert isinstance(get_renderer("unknown"), TextRenderer)
+    # Instances are reused
+    assert get_renderer("json") is get_renderer("json")
+    assert get_renderer("text", plain=True) is not get_renderer("text")
 
 
-def test_json_renderer(minimal_repo: Path):
-    """Test JSON renderer produces valid JSON."""
-    report = scan(minimal_repo, Config())
-    renderer = JsonRenderer()
-    output = renderer.render(report)
-
-    # Should be valid JSON
-    data = json.loads(output)
-    assert "meta" in data
-    assert "summary" in data
-    assert "findings" in data
+def test_json_renderer(minimal_report: Report):
+    """Test JSON renderer produces valid JSON whose structure matches spec."""
+    data = json.loads(JsonRenderer().render(minimal_report))
 
+    assert data.keys() >= {"meta", "repo", "summary", "findings", "metrics"}
+    assert data["meta"].keys() >= {"tool_version", "timestamp", "duration_ms"}
+    assert data["summary"].keys() >= {
+        "total_score",
+        "grade",
+        "counts_by_severity",
+        "counts_by_category",
+    }
+    assert data["repo"].keys() >= {"path", "git"}
 
-def test_json_renderer_structure(minimal_repo: Path):
-    """Test JSON structure matches spec."""
-    report = scan(minimal_repo, Config())
-    renderer = JsonRenderer()
-    data = json.loads(renderer.render(report))
 
-    # Meta fields
-    assert "tool_version" in data["meta"]
-    assert "timestamp" in data["meta"]
-    assert "duration_ms" in data["meta"]
+def test_json_renderer_without_orjson(bad_report: Report, monkeypatch):
+    """Test the stdlib fallback produces the same document, byte for byte."""
+    from rhc.renderers import json as json_renderer
 
-    # Summary fields
-    assert "total_score" in data["summary"]
-    assert "grade" in data["summary"]
-    assert "counts_by_severity" in data["summary"]
-    assert "counts_by_category" in data["summary"]
+    fast = JsonRenderer().render(bad_report)
+    assert json.loads(fast) == bad_report.to_dict()
+    monkeypatch.setattr(json_renderer, "orjson", None)
+    assert JsonRenderer().render(bad_report) == fast
 
-    # Repo info
-    assert "path" in data["repo"]
-    assert "git" in data["repo"]
 
-
-def test_text_renderer(minimal_repo: Path):
+def test_text_renderer(minimal_report: Report):
     """Test text renderer produces output."""
-    report = scan(minimal_repo, Config())
     renderer = TextRenderer()
-    output = renderer.render(report)
+    output = renderer.render(minimal_report)
 
     assert "RHC Report" in output
     assert "Score:" in output or "score" in output.lower()
 
 
-def test_markdown_renderer(minimal_repo: Path):
+def test_markdown_renderer(minimal_report: Report):
     """Test markdown renderer produces valid markdown."""
-    report = scan(minimal_repo, Config())
     renderer = MarkdownRenderer()
-    output = renderer.render(report)
+    output = renderer.render(minimal_report)
 
     # Should have markdown elements
     assert "# Repo Health Check Report" in output
@@ -75,11 +87,10 @@ def test_markdown_renderer(minimal_repo: Path):
     assert "## Summary" in output
 
 
-def test_markdown_renderer_with_findings(bad_repo: Path):
+def test_markdown_renderer_with_findings(bad_report: Report):
     """Test markdown renderer includes findings table."""
-    report = scan(bad_repo, Config())
     renderer = MarkdownRenderer()
-    output = renderer.render(report)
+    output = renderer.render(bad_report)
 
     # Should have findings table
     assert "## Findings" in output
@@ -87,21 +98,38 @@ def test_markdown_renderer_with_findings(bad_repo: Path):
     assert "| Check |" in output
 
 
-def test_markdown_renderer_recommendations(bad_repo: Path):
+def test_markdown_renderer_recommendations(bad_report: Report):
     """Test markdown renderer includes recommendations."""
-    report = scan(bad_repo, Config())
     renderer = MarkdownRenderer()
-    output = renderer.render(report)
+    output = renderer.render(bad_report)
 
     # Should have recommendations
     assert "## Recommendations" in output
 
 
-def test_text_renderer_no_findings(good_repo: Path):
+def test_text_renderer_no_findings(good_report: Report):
     """Test text renderer with minimal findings."""
-    report = scan(good_repo, Config())
     renderer = TextRenderer()
-    output = renderer.render(report)
+    output = renderer.render(good_report)
 
     # Should indicate good health
     assert "RHC Report" in output
+
+
+def test_text_renderer_writes_nothing_itself(bad_report: Report, capsys):
+    """Test rendering only returns the report; colors are opt-in."""
+    plain_output = TextRenderer().render(bad_report)
+    color_output = TextRenderer(color=True).render(bad_report)
+
+    assert capsys.readouterr().out == ""
+    assert "\x1b[" not in plain_output
+    assert "\x1b[" in color_output
+
+
+def test_text_renderer_styles_only_markup(bad_report: Report):
+    """Test counts and versions are not auto-highlighted in colored output."""
+    output = TextRenderer(color=True).render(bad_report)
+    summary = next(line for line in output.splitlines() if line.startswith("Issues: "))
+
+    assert "\x1b[" not in summary
+    assert f"rhc v{bad_report.meta.tool_version} |" in output
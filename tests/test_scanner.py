@@ -2,9 +2,26 @@
 
 from pathlib import Path
 
-from rhc.config import Config
+from rhc.checks import (
+    ALL_CHECKS,
+    CHECK_LOCATIONS,
+    CHECKS_BY_ID,
+    get_all_checks,
+    get_check_by_id,
+    get_checks,
+    run_all,
+)
+from rhc.config import ChecksConfig, Config
+from rhc.context import Context
 from rhc.scanner import scan
-from rhc.scoring import calculate_grade, calculate_score
+from rhc.scoring import (
+    calculate_grade,
+    calculate_score,
+    check_policy_violation,
+    count_by_category,
+    count_by_severity,
+    create_summary,
+)
 from rhc.types import Category, Finding, Severity
 
 
@@ -51,6 +68,25 @@ def test_calculate_score_clamps_to_zero():
     assert score == 0
 
 
+def test_severity_ordering():
+    """Test severities compare by rank, not alphabetically."""
+    assert Severity.INFO < Severity.LOW < Severity.MEDIUM < Severity.HIGH < Severity.CRITICAL
+    assert Severity.CRITICAL >= Severity.HIGH
+    assert not Severity.LOW >= Severity.HIGH
+    assert max(Severity) == Severity.CRITICAL
+    assert [s.rank for s in Severity] == [0, 1, 2, 3, 4]
+    assert Severity("high") is Severity.HIGH and Severity.HIGH == "high"
+
+
+def test_fail_on_ignores_lower_severities():
+    """Test the fail_on policy only trips on findings at or above the level."""
+    low = Finding(id="T.LOW", title="t", severity=Severity.LOW, category=Category.DOCS, score_impact=-1)
+    summary = create_summary([low])
+
+    assert check_policy_violation([low], summary, fail_on=Severity.HIGH) == (False, "")
+    assert check_policy_violation([low], summary, fail_on=Severity.LOW)[0]
+
+
 def test_grades():
     """Test grade mapping."""
     assert calculate_grade(100) == "A"
@@ -66,9 +102,9 @@ def test_grades():
     assert calculate_grade(0) == "F"
 
 
-def test_scan_minimal_repo(minimal_repo: Path):
+def test_scan_minimal_repo(minimal_repo: Path, default_config: Config):
     """Test scanning a minimal repo produces a report."""
-    report = scan(minimal_repo, Config())
+    report = scan(minimal_repo, default_config)
 
     assert report.summary.total_score > 0
     assert report.summary.grade in ["A", "B", "C", "D", "F"]
@@ -77,28 +113,46 @@ def test_scan_minimal_repo(minimal_repo: Path):
     assert isinstance(report.findings, list)
 
 
-def test_scan_good_repo(good_repo: Path):
+def test_scan_good_repo(good_repo: Path, default_config: Config):
     """Test a good repo scores high."""
-    report = scan(good_repo, Config())
+    report = scan(good_repo, default_config)
 
     # Good repo should have very few findings
     assert report.summary.total_score >= 80, f"Score {report.summary.total_score} too low"
     assert report.summary.grade in ["A", "B"]
 
 
-def test_scan_bad_repo(bad_repo: Path):
+def test_scan_bad_repo(bad_repo: Path, default_config: Config):
     """Test a bad repo has many findings."""
-    report = scan(bad_repo, Config())
+    report = scan(bad_repo, default_config)
 
     # Bad repo should have many issues
     assert len(report.findings) >= 5
     assert report.summary.total_score < 70
 
 
+def test_create_summary_matches_helpers(bad_repo: Path, default_config: Config):
+    """Test the single-pass summary agrees with the individual helpers."""
+    findings = scan(bad_repo, default_config).findings
+    summary = create_summary(findings)
+
+    assert summary.total_score == calculate_score(findings)
+    assert summary.counts_by_severity == count_by_severity(findings)
+    assert summary.counts_by_category == count_by_category(findings)
+
+
+def test_scan_sorts_findings_by_severity(bad_repo: Path, default_config: Config):
+    """Test findings come highest severity first, then largest impact first."""
+    report = scan(bad_repo, default_config)
+    order = list(Severity)
+    keys = [(-order.index(f.severity), f.score_impact) for f in report.findings]
+
+    assert keys == sorted(keys)
+
+
 def test_scan_with_skip_config(minimal_repo: Path):
     """Test skipping checks via config."""
-    config = Config()
-    config.checks.skip = ["DOC.LICENSE_PRESENT", "DOC.CONTRIBUTING_PRESENT"]
+    config = Config(checks=ChecksConfig(skip=("DOC.LICENSE_PRESENT", "DOC.CONTRIBUTING_PRESENT")))
 
     report = scan(minimal_repo, config)
 
@@ -109,8 +163,7 @@ def test_scan_with_skip_config(minimal_repo: Path):
 
 def test_scan_with_only_config(minimal_repo: Path):
     """Test running only specific checks."""
-    config = Config()
-    config.checks.only = ["DOC.README_PRESENT"]
+    config = Config(checks=ChecksConfig(only=("DOC.README_PRESENT",)))
 
     report = scan(minimal_repo, config)
 
@@ -119,9 +172,30 @@ def test_scan_with_only_config(minimal_repo: Path):
         assert finding.id == "DOC.README_PRESENT"
 
 
-def test_report_to_dict(minimal_repo: Path):
+def test_get_checks_only_keeps_registry_order():
+    """Test selecting checks by ID ignores unknown IDs and keeps registry order."""
+    checks = get_checks(["HYG.GITIGNORE_PRESENT", "NOPE", "DOC.README_PRESENT"])
+
+    assert [check.id for check in checks] == ["DOC.README_PRESENT", "HYG.GITIGNORE_PRESENT"]
+    assert len(get_checks()) == len(CHECK_LOCATIONS)
+
+
+def test_run_all_parallel_matches_serial(bad_repo: Path):
+    """Test the thread-pool runner returns the same findings, in the same order."""
+    config = Config()
+    checks = get_all_checks()
+    parallel = run_all(Context.build(bad_repo, config), checks)
+
+    config = Config(checks=ChecksConfig(parallel=False))
+    serial = run_all(Context.build(bad_repo, config), checks)
+
+    assert [f.to_dict() for f in parallel] == [f.to_dict() for f in serial]
+    assert parallel
+
+
+def test_report_to_dict(minimal_repo: Path, default_config: Config):
     """Test report serialization."""
-    report = scan(minimal_repo, Config())
+    report = scan(minimal_repo, default_config)
     data = report.to_dict()
 
     assert "meta" in data
@@ -130,3 +204,32 @@ def test_report_to_dict(minimal_repo: Path):
     assert "findings" in data
     assert "metrics" in data
     assert data["meta"]["tool_version"] == "0.1.0"
+
+
+def test_get_check_by_id():
+    """Test check lookup by ID."""
+    check = get_check_by_id("DOC.README_PRESENT")
+    assert check is not None
+    assert check.id == "DOC.README_PRESENT"
+    assert get_check_by_id("NOPE.UNKNOWN") is None
+
+
+def test_checks_by_id_covers_all_checks():
+    """Test the ID registry has one entry per check class."""
+    assert len(CHECKS_BY_ID) == len(ALL_CHECKS)
+    for check_id, check_class in CHECKS_BY_ID.items():
+        assert check_class.info.id == check_id
+
+
+def test_check_instances_are_shared():
+    """Test registry hands out the same stateless check instances."""
+    assert get_all_checks()[0] is get_all_checks()[0]
+    assert get_check_by_id("DOC.README_PRESENT") is get_check_by_id("DOC.README_PRESENT")
+
+
+def test_check_locations_match_classes():
+    """Test every lazily registered check resolves to a class with that ID."""
+    for check_id in CHECK_LOCATIONS:
+        check = get_check_by_id(check_id)
+        assert check is not None
+        assert check.id == check_id